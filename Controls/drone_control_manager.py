@@ -28,14 +28,14 @@ class DroneControlManager:
         self._sideward += dx
         self._forward  += dy
         self._upward   += dz
-        logger.debug_at_level(DEBUG_L3, "DroneControlManager", f"Movement command received: dx={dx}, dy={dy}, dz={dz}")
+        logger.debug_at_level(DEBUG_L3, "DroneControlManager", "Movement command received: dx=%s, dy=%s, dz=%s", dx, dy, dz)
 
     def _on_rotate(self, delta):
         self._yaw_rate += delta
-        logger.debug_at_level(DEBUG_L3, "DroneControlManager", f"Rotation command received: delta={delta}")
+        logger.debug_at_level(DEBUG_L3, "DroneControlManager", "Rotation command received: delta=%s", delta)
 
     def _update(self, dt):
-        logger.debug_at_level(DEBUG_L3, "DroneControlManager", f"Updating movement with dt={dt}")
+        logger.debug_at_level(DEBUG_L3, "DroneControlManager", "Updating movement with dt=%s", dt)
         self.camera_movement_controller.update(
             self._forward, 
             self._sideward, 
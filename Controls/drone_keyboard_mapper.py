@@ -16,35 +16,30 @@ def register_drone_keyboard_mapper(config):
     logger.info("DroneKeyboardMapper", "Registering drone keyboard controls")
     logger.debug_at_level(DEBUG_L1, "DroneKeyboardMapper", f"Move step: {move_step}, Rotate step: {rotate_step} rad")
 
+    # key -> (topic, payload, description); one dict lookup instead of an if/elif chain
+    key_bindings = {
+        'w': ('keyboard/move', (0, move_step, 0), "Forward movement"),
+        's': ('keyboard/move', (0, -move_step, 0), "Backward movement"),
+        'a': ('keyboard/move', (-move_step, 0, 0), "Left movement"),
+        'd': ('keyboard/move', (move_step, 0, 0), "Right movement"),
+        ' ': ('keyboard/move', (0, 0, move_step), "Up movement"),
+        'z': ('keyboard/move', (0, 0, -move_step), "Down movement"),
+        'q': ('keyboard/rotate', rotate_step, "Rotate left"),
+        'e': ('keyboard/rotate', -rotate_step, "Rotate right"),
+    }
+
     def on_key_pressed(key):
-        if KM.in_typing_mode():
-            logger.debug_at_level(DEBUG_L2, "DroneKeyboardMapper", f"Ignoring key {key} - typing mode active")
+        # Unbound keys are dropped before the typing-mode check
+        binding = key_bindings.get(key)
+        if binding is None:
+            return
+        if KM.typing_mode:
+            logger.debug_at_level(DEBUG_L2, "DroneKeyboardMapper", "Ignoring key %s - typing mode active", key)
             return 
 
-        if key == 'w':
-            EM.publish('keyboard/move', (0, move_step, 0))
-            logger.debug_at_level(DEBUG_L3, "DroneKeyboardMapper", "Forward movement")
-        elif key == 's':
-            EM.publish('keyboard/move', (0, -move_step, 0))
-            logger.debug_at_level(DEBUG_L3, "DroneKeyboardMapper", "Backward movement")
-        elif key == 'a':
-            EM.publish('keyboard/move', (-move_step, 0, 0))
-            logger.debug_at_level(DEBUG_L3, "DroneKeyboardMapper", "Left movement")
-        elif key == 'd':
-            EM.publish('keyboard/move', (move_step, 0, 0))
-            logger.debug_at_level(DEBUG_L3, "DroneKeyboardMapper", "Right movement")
-        elif key == ' ':
-            EM.publish('keyboard/move', (0, 0, move_step))
-            logger.debug_at_level(DEBUG_L3, "DroneKeyboardMapper", "Up movement")
-        elif key == 'z':
-            EM.publish('keyboard/move', (0, 0, -move_step))
-            logger.debug_at_level(DEBUG_L3, "DroneKeyboardMapper", "Down movement")
-        elif key == 'q':
-            EM.publish('keyboard/rotate', rotate_step)
-            logger.debug_at_level(DEBUG_L3, "DroneKeyboardMapper", "Rotate left")
-        elif key == 'e':
-            EM.publish('keyboard/rotate', -rotate_step)
-            logger.debug_at_level(DEBUG_L3, "DroneKeyboardMapper", "Rotate right")
+        topic, payload, description = binding
+        EM.publish(topic, payload)
+        logger.debug_at_level(DEBUG_L3, "DroneKeyboardMapper", description)
 
     EM.subscribe('keyboard/key_pressed', on_key_pressed)
     logger.debug_at_level(DEBUG_L1, "DroneKeyboardMapper", "Keyboard event subscriptions registered")
@@ -19,12 +19,12 @@ class DroneMovementTransformer:
 
     def update(self, forward, sideward, upward, yaw_rate, dt):
         yaw = SC.sim.getObjectOrientation(self.drone_base, -1)[2]
-        logger.debug_at_level(DEBUG_L3, "DroneMovementTransformer", f"Current yaw: {yaw}")
+        logger.debug_at_level(DEBUG_L3, "DroneMovementTransformer", "Current yaw: %s", yaw)
 
         dx = -forward * math.cos(yaw) - sideward * math.sin(yaw)
         dy = -forward * math.sin(yaw) + sideward * math.cos(yaw)
         dz = upward
 
         world_velocity = (dx, dy, dz)
-        logger.debug_at_level(DEBUG_L3, "DroneMovementTransformer", f"Calculated world velocity: ({dx}, {dy}, {dz})")
+        logger.debug_at_level(DEBUG_L3, "DroneMovementTransformer", "Calculated world velocity: (%s, %s, %s)", dx, dy, dz)
         self.target_mover.update(world_velocity, yaw_rate, dt)
@@ -21,8 +21,8 @@ class TargetMover:
         pos = SC.sim.getObjectPosition(self.target, -1)
         ori = SC.sim.getObjectOrientation(self.target, -1)
         
-        logger.debug_at_level(DEBUG_L3, "TargetMover", f"Current position: {pos}, orientation: {ori}")
-        logger.debug_at_level(DEBUG_L3, "TargetMover", f"Desired velocity: {desired_velocity}, yaw rate: {desired_yaw_rate}")
+        logger.debug_at_level(DEBUG_L3, "TargetMover", "Current position: %s, orientation: %s", pos, ori)
+        logger.debug_at_level(DEBUG_L3, "TargetMover", "Desired velocity: %s, yaw rate: %s", desired_velocity, desired_yaw_rate)
 
         # Simple inertia model: move current velocity toward desired velocity
         for i in range(3):
@@ -32,7 +32,7 @@ class TargetMover:
         delta_yaw = desired_yaw_rate - self.current_yaw_rate
         self.current_yaw_rate += delta_yaw * min(self.response_speed * dt, 1.0)
         
-        logger.debug_at_level(DEBUG_L3, "TargetMover", f"Updated velocity: {self.current_velocity}, yaw rate: {self.current_yaw_rate}")
+        logger.debug_at_level(DEBUG_L3, "TargetMover", "Updated velocity: %s, yaw rate: %s", self.current_velocity, self.current_yaw_rate)
 
         new_pos = [
             pos[0] + self.current_velocity[0] * dt,
@@ -45,7 +45,7 @@ class TargetMover:
             ori[2] + self.current_yaw_rate * dt
         ]
         
-        logger.debug_at_level(DEBUG_L3, "TargetMover", f"New position: {new_pos}, new orientation: {new_ori}")
+        logger.debug_at_level(DEBUG_L3, "TargetMover", "New position: %s, new orientation: %s", new_pos, new_ori)
 
         SC.sim.setObjectPosition(self.target, -1, new_pos)
         SC.sim.setObjectOrientation(self.target, -1, new_ori)
@@ -22,6 +22,8 @@ class EventManager:
             raise Exception("EventManager already exists! Use EventManager.get_instance() to get the singleton instance.")
         
         self.listeners = defaultdict(list)
+        # Immutable per-topic callback snapshots read lock-free by publish_fast()
+        self._snapshots = {}
         self.lock = threading.Lock()
         EventManager._instance = self
         
@@ -35,6 +37,7 @@ class EventManager:
         """
         with self.lock:
             self.listeners[topic].append(callback)
+            self._snapshots[topic] = tuple(self.listeners[topic])
         self.logger.debug_at_level(DEBUG_L1, "EventManager", f"Subscribed to topic '{topic}'")
 
     def unsubscribe(self, topic, callback):
@@ -44,10 +47,27 @@ class EventManager:
         with self.lock:
             if topic in self.listeners and callback in self.listeners[topic]:
                 self.listeners[topic].remove(callback)
+                self._snapshots[topic] = tuple(self.listeners[topic])
                 self.logger.debug_at_level(DEBUG_L1, "EventManager", f"Unsubscribed from topic '{topic}'")
             else:
                 self.logger.warning("EventManager", f"Could not unsubscribe from topic '{topic}' - callback not found")
 
+    def unsubscribe_many(self, subscriptions):
+        """
+        Unsubscribe several (topic, callback) pairs under a single lock acquisition.
+        """
+        missing = []
+        with self.lock:
+            for topic, callback in subscriptions:
+                if topic in self.listeners and callback in self.listeners[topic]:
+                    self.listeners[topic].remove(callback)
+                    self._snapshots[topic] = tuple(self.listeners[topic])
+                else:
+                    missing.append(topic)
+        self.logger.debug_at_level(DEBUG_L1, "EventManager", "Unsubscribed %d callback(s)", len(subscriptions) - len(missing))
+        for topic in missing:
+            self.logger.warning("EventManager", f"Could not unsubscribe from topic '{topic}' - callback not found")
+
     def publish(self, topic, data=None):
         """
         Publish an event to all subscribers of a topic.
@@ -58,13 +78,13 @@ class EventManager:
         # Log event publication at different detail levels based on event type
         if topic.startswith('keyboard/'):
             # Keyboard events are very frequent, so use highest debug level
-            self.logger.debug_at_level(DEBUG_L3, "EventManager", f"Publishing '{topic}' event with data: {data}")
+            self.logger.debug_at_level(DEBUG_L3, "EventManager", "Publishing '%s' event with data: %s", topic, data)
         elif topic == 'simulation/frame':
             # Frame updates are very frequent, so use highest debug level
-            self.logger.debug_at_level(DEBUG_L3, "EventManager", f"Publishing frame event with dt: {data}")
+            self.logger.debug_at_level(DEBUG_L3, "EventManager", "Publishing frame event with dt: %s", data)
         else:
             # Other events are less frequent, use medium debug level
-            self.logger.debug_at_level(DEBUG_L2, "EventManager", f"Publishing '{topic}' event with data: {data}")
+            self.logger.debug_at_level(DEBUG_L2, "EventManager", "Publishing '%s' event with data: %s", topic, data)
 
         for callback in callbacks:
             try:
@@ -72,10 +92,23 @@ class EventManager:
             except Exception as e:
                 self.logger.error("EventManager", f"Error calling subscriber for topic '{topic}': {e}")
 
+    def publish_fast(self, topic, data=None):
+        """
+        Publish a high-frequency event (e.g. 'simulation/frame') without locking or logging.
+        Dispatches over the snapshot taken at the last (un)subscribe; a failing subscriber
+        is still logged and does not stop the others.
+        """
+        for callback in self._snapshots.get(topic, ()):
+            try:
+                callback(data)
+            except Exception as e:
+                self.logger.error("EventManager", f"Error calling subscriber for topic '{topic}': {e}")
+
     def unsubscribe_all(self):
         """
         Remove all subscriptions (e.g., for shutdown).
         """
         with self.lock:
             self.listeners.clear()
+            self._snapshots.clear()
         self.logger.info("EventManager", "Cleared all subscriptions")
@@ -40,8 +40,10 @@ class CameraManager:
         EM.subscribe('config/updated', self._on_config_updated)
         logger.debug_at_level(DEBUG_L1, "CameraManager", "Event subscriptions registered")
     
-    def _on_config_updated(self, _):
+    def _on_config_updated(self, key):
         """Update configuration settings."""
+        if key not in (None, 'verbose'):
+            return  # Only the verbose flag is read here
         from Utils.config_utils import get_default_config
         config = get_default_config()
         self.verbose = config.get('verbose', False)
@@ -80,7 +82,7 @@ class CameraManager:
         for sensor in self.vision_sensors:
             try:
                 SC.sim.handleVisionSensor(sensor)
-                logger.debug_at_level(DEBUG_L3, "CameraManager", f"Handled vision sensor: {sensor}")
+                logger.debug_at_level(DEBUG_L3, "CameraManager", "Handled vision sensor: %s", sensor)
             except Exception as e:
                 logger.error("CameraManager", f"Error handling vision sensor {sensor}: {e}")
                 # Remove invalid sensors
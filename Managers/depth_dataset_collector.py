@@ -2,13 +2,14 @@ import os
 import numpy as np
 import math
 import threading
-import copy
-import random
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 
-from Utils.capture_utils import capture_depth, capture_pose, capture_distance_to_victim
+from Utils.capture_utils import capture_depth, capture_pose, capture_victim_position
+from Utils.save_utils import write_npz_compressed
 from Utils.config_utils import get_default_config
-from Utils.log_utils import get_logger, DEBUG_L1, DEBUG_L2, DEBUG_L3
+from Utils.log_utils import get_logger, DEBUG_L1, DEBUG_L2
 from Utils.episode_utils import EPISODE_START, EPISODE_END, EPISODE_SAVE_COMPLETED, EPISODE_SAVE_ERROR
 from Managers.scene_manager import SCENE_CREATION_COMPLETED, SCENE_CLEARED
 from Utils.action_label_utils import get_action_label
@@ -26,66 +27,68 @@ DATASET_CAPTURE_COMPLETE = 'dataset/capture/complete'  # Data point captured suc
 VICTIM_DETECTED = 'victim/detected'                   # Victim detected in frame
 DATASET_CONFIG_UPDATED = 'dataset/config/updated'     # Dataset configuration updated
 
-def get_victim_direction():
+# Payload of DATASET_CAPTURE_COMPLETE, reused for every capture. Subscribers are called
+# synchronously and must copy what they need instead of keeping the dict.
+_CAPTURE_EVENT = {'frame': 0, 'distance': 0.0, 'action': None, 'victim_vec': None}
+
+# Initial number of rows reserved in the preallocated episode buffers
+EPISODE_BUFFER_CAPACITY = 64
+
+# Episode split assignment probabilities (90% train, 10% val)
+SPLIT_NAMES = ("train", "val")
+SPLIT_PROBABILITIES = (0.9, 0.1)
+# Split assignments drawn at once
+SPLIT_DRAW_BLOCK = 4096
+
+# Episodes saved concurrently, and episodes that may be pending before episode end blocks
+SAVE_WORKERS = 2
+SAVE_QUEUE_SIZE = 4
+
+def _grow_buffer(buffer):
+    """Return a buffer with twice the rows of `buffer`, keeping its content."""
+    grown = np.empty((2 * len(buffer),) + buffer.shape[1:], dtype=buffer.dtype)
+    grown[:len(buffer)] = buffer
+    return grown
+
+def _victim_direction_from(quad_pos, victim_pos, cos_yaw, sin_yaw):
     """
     Returns a unit direction vector and distance from quadcopter to victim,
-    transformed to be relative to the drone's current orientation.
-    
+    transformed to be relative to the drone's current orientation. Works on already-read
+    positions and yaw trig, so the frame handler can reuse the pose it captured.
+
     Returns:
         tuple: ((dx, dy, dz), distance) - normalized direction vector and Euclidean distance
     """
-    try:
-        # Get object handles
-        quad = SC.sim.getObject('/Quadcopter')
-        vic = SC.sim.getObject('/Victim')
-
-        # Get positions
-        qx, qy, qz = SC.sim.getObjectPosition(quad, -1)
-        vx, vy, vz = SC.sim.getObjectPosition(vic, -1)
-
-        # Calculate vector components and distance in world coordinates
-        dx_world, dy_world, dz_world = vx - qx, vy - qy, vz - qz
-        distance = math.sqrt(dx_world*dx_world + dy_world*dy_world + dz_world*dz_world)
-        
-        # Get drone's orientation (Euler angles in radians)
-        drone_orientation = SC.sim.getObjectOrientation(quad, -1)
-        alpha, beta, gamma = drone_orientation  # Roll, pitch, yaw
-        
-        # Fix the transformation by first calculating the correct angle
-        # CoppeliaSim's coordinate system: X right, Y forward, Z up
-        # We need to adjust gamma (yaw) to match our display conventions
-        cos_yaw = math.cos(gamma)
-        sin_yaw = math.sin(gamma)
-        
-        # Correct transformation with proper rotation matrix
-        # This transformation ensures "forward" on the display corresponds to
-        # the drone's forward direction (Y-axis in CoppeliaSim)
-        # We need to invert the sign of dy to fix the backwards issue
-        dx = -dx_world * sin_yaw + dy_world * cos_yaw  # Left-right axis (X in display)
-        dy = -dx_world * cos_yaw - dy_world * sin_yaw   # Forward-back axis (Y in display)
-        dz = dz_world  # Keep the original Z difference for elevation
-
-        # Calculate normalized direction vector (unit vector)
-        if distance < 0.0001:  # Avoid division by near-zero
-            unit_vector = (0.0, 0.0, 0.0)
-        else:
-            unit_vector = (dx / distance, dy / distance, dz / distance)
-
-        logger.debug_at_level(DEBUG_L3, "DepthCollector", f"Victim direction: {unit_vector}, distance: {distance}")
-        return unit_vector, distance
-        
-    except Exception as e:
-        logger.error("DepthCollector", f"Error calculating victim direction: {e}")
-        return (0.0, 0.0, 0.0), -1.0  # Return zero vector and invalid distance on error
+    qx, qy, qz = quad_pos
+    vx, vy, vz = victim_pos
+
+    # Calculate vector components and distance in world coordinates
+    dx_world, dy_world, dz_world = vx - qx, vy - qy, vz - qz
+    distance = math.sqrt(dx_world*dx_world + dy_world*dy_world + dz_world*dz_world)
+
+    # CoppeliaSim's coordinate system: X right, Y forward, Z up
+    # Correct transformation with proper rotation matrix
+    # This transformation ensures "forward" on the display corresponds to
+    # the drone's forward direction (Y-axis in CoppeliaSim)
+    # We need to invert the sign of dy to fix the backwards issue
+    dx = -dx_world * sin_yaw + dy_world * cos_yaw  # Left-right axis (X in display)
+    dy = -dx_world * cos_yaw - dy_world * sin_yaw   # Forward-back axis (Y in display)
+    dz = dz_world  # Keep the original Z difference for elevation
+
+    # Calculate normalized direction vector (unit vector); one division, zero vector near the victim
+    inv_distance = 1.0 / distance if distance >= 0.0001 else 0.0  # Avoid division by near-zero
+    return (dx * inv_distance, dy * inv_distance, dz * inv_distance), distance
 
 class DepthDatasetCollector:
     def __init__(self, sensor_handle,
                  base_folder=None,
                  batch_size=500,
                  save_every_n_frames=10,
-                 split_ratio=(0.98, 0.01, 0.01)):
+                 split_ratio=(0.98, 0.01, 0.01),
+                 depth_dtype=np.float16):
         """
         Main depth dataset collector - now episode-based.
+        Depth frames are stored as `depth_dtype` (float16 by default, half the bytes of float32).
         """
         # Verbose logging flag from configuration
         self.verbose = get_default_config().get('verbose', False)
@@ -107,24 +110,42 @@ class DepthDatasetCollector:
 
         self.batch_size = batch_size
         self.save_every_n_frames = save_every_n_frames
-        self.train_ratio, self.val_ratio, self.test_ratio = split_ratio        # Episode data buffers
-        self.episode_depths = []
-        self.episode_poses = []
-        self.episode_frames = []
-        self.episode_distances = []
-        self.episode_actions = []
-        self.episode_victim_dirs = []
+        self.train_ratio, self.val_ratio, self.test_ratio = split_ratio
+        self.depth_dtype = np.dtype(depth_dtype)
+        # Episode data buffers (one preallocated array per field, written in place).
+        # The depth buffer is allocated on the first capture, once the sensor resolution is known.
+        # Sets whose save has finished wait in the pool for reuse.
+        self._allocate_episode_buffers(EPISODE_BUFFER_CAPACITY)
+        self._buffer_pool = queue.SimpleQueue()
+        self._episode_len = 0
         self.current_episode_number = 0
 
+        # Scene object handles, cached while a scene exists
+        self._quad_handle = None
+        self._victim_handle = None
+
+        # Scratch pose for frames that are only logged, not captured
+        self._pose_scratch = np.empty(6, dtype=np.float32)
+        # 1-slot cache of the last yaw and its cos/sin (yaw is unchanged on most frames)
+        self._trig_yaw = 0.0
+        self._cos_yaw, self._sin_yaw = 1.0, 0.0
+
         # Setup folders
         self.train_folder = os.path.join(self.base_folder, "train")
         self.val_folder   = os.path.join(self.base_folder, "val")
         for folder in [self.train_folder, self.val_folder]:
             os.makedirs(folder, exist_ok=True)
             logger.debug_at_level(DEBUG_L1, "DepthCollector", f"Created directory: {folder}")
+        self._split_folders = {"train": self.train_folder, "val": self.val_folder}
+
+        # Split assignments are taken from a pre-drawn block, refilled when used up
+        self._split_rng = np.random.default_rng()
+        self._split_choices = self._draw_splits()
+        self._split_idx = 0
 
         # Counters
         self.global_frame_counter = 0
+        self._ticks_until_capture = save_every_n_frames  # countdown to the next episode capture
         self.train_counter = 0
         self.val_counter   = 0
         self.test_counter  = 0
@@ -135,8 +156,11 @@ class DepthDatasetCollector:
 
         # Episode collection activation flag
         self.collecting_episode = False
+        # Set when a depth frame could not join the episode buffer; the episode is not saved
+        self._episode_failed = False
         # Activation flags
         self.logging_active = False
+        self._frame_subscribed = False
         # Subscribe to episode events instead of scene events
         EM.subscribe(EPISODE_START, self._on_episode_start)
         EM.subscribe(EPISODE_END, self._on_episode_end)
@@ -148,8 +172,11 @@ class DepthDatasetCollector:
 
         logger.debug_at_level(DEBUG_L1, "DepthCollector", "Event subscriptions registered")
 
-        # Track async save threads
-        self._save_threads = []
+        # Background savers; the bounded slot count applies backpressure if disk writes fall behind
+        self._saver_pool = ThreadPoolExecutor(max_workers=SAVE_WORKERS, thread_name_prefix="EpisodeSaver")
+        self._save_slots = threading.BoundedSemaphore(SAVE_QUEUE_SIZE)
+        self._save_futures = []
+        self.save_queue_high_water = 0
 
     def _on_episode_start(self, data):
         """
@@ -157,23 +184,17 @@ class DepthDatasetCollector:
         """
         self.current_episode_number = data.get('episode_number', 0)
         self.collecting_episode = True
-        
-        # Clear episode buffers
-        self.episode_depths = []
-        self.episode_poses = []
-        self.episode_frames = []
-        self.episode_distances = []
-        self.episode_actions = []
-        self.episode_victim_dirs = []
+        self._episode_failed = False
+        self._episode_len = 0
+        self._ticks_until_capture = self.save_every_n_frames
         
         logger.info("DepthCollector", f"Started collecting data for episode {self.current_episode_number}")
 
         # Reset yaw tracking for action label detection
         action_label_utils._prev_yaw = None
 
-        # Subscribe to simulation frame events for data capture only after scene is ready
-        EM.subscribe('simulation/frame', self._on_simulation_frame)
-        logger.debug_at_level(DEBUG_L1, "DepthCollector", "Subscribed to simulation/frame after scene creation")
+        # Capture runs inside the shared frame handler only after scene is ready
+        self._update_frame_subscription()
 
     def _on_episode_end(self, data):
         """
@@ -184,117 +205,218 @@ class DepthDatasetCollector:
             return
             
         episode_number = data.get('episode_number', self.current_episode_number)
-        logger.info("DepthCollector", f"Episode {episode_number} ended, saving {len(self.episode_depths)} data points")
+        logger.info("DepthCollector", f"Episode {episode_number} ended, saving {self._episode_len} data points")
         
-        if self.episode_depths:
-            # Save actions as integer codes
-            actions_int = [a.value for a in self.episode_actions]
-            episode_data = {
-                'depths': self._safe_stack('episode_depths', self.episode_depths, np.float32),
-                'poses': self._safe_stack('episode_poses', self.episode_poses, np.float32),
-                'frames': self._safe_stack('episode_frames', self.episode_frames, np.int32),
-                'distances': self._safe_stack('episode_distances', self.episode_distances, np.float32),
-                'actions': np.array(actions_int, dtype=np.uint8),
-                'victim_dirs': self._safe_stack('episode_victim_dirs', self.episode_victim_dirs, np.float32)
-            }
-            # Check if all data was successfully stacked
-            if all(v is not None for v in episode_data.values()):
-                # Deep copy data for thread safety
-                episode_data_copy = copy.deepcopy(episode_data)
-                # Randomly assign split (90% train, 10% val)
-                split = "train" if random.random() < 0.9 else "val"
-                split_dir = self.train_folder if split == "train" else self.val_folder
-                os.makedirs(split_dir, exist_ok=True)
-                filename = f"episode_{episode_number:05d}.npz"
-                save_path = os.path.join(split_dir, filename)
-                
-                
-                def save_worker():
-                    # Save the dataset (only this I/O is caught)
-                    try:
-                        np.savez_compressed(
-                            save_path,
-                            depths      = episode_data_copy['depths'],
-                            poses       = episode_data_copy['poses'],
-                            frames      = episode_data_copy['frames'],
-                            distances   = episode_data_copy['distances'],
-                            actions     = episode_data_copy['actions'],
-                            victim_dirs = episode_data_copy['victim_dirs'],
-                        )
-                        logger.info("DepthCollector", f"[Async] Successfully saved episode {episode_number} to {save_path}")
-                        EM.publish(EPISODE_SAVE_COMPLETED, {'episode_number': episode_number})
-                    except Exception as e:
-                        logger.error("DepthCollector", f"[Async] Failed to save episode {episode_number} to {save_path}: {e}")
-                        EM.publish(EPISODE_SAVE_ERROR, {'episode_number': episode_number})
-                        
-                t = threading.Thread(target=save_worker, name=f"EpisodeSave-{episode_number}")
-                t.start()
-                self._save_threads.append(t)
-            else:
-                logger.error("DepthCollector", f"Failed to prepare data for episode {episode_number}")
-                EM.publish(EPISODE_SAVE_ERROR, {'episode_number': episode_number})
+        if self._episode_failed:
+            logger.error("DepthCollector", f"Episode {episode_number} not saved: its depth frames could not be captured consistently")
+            EM.publish(EPISODE_SAVE_ERROR, {'episode_number': episode_number})
+        elif self._episode_len:
+            # The save thread takes ownership of the filled buffers instead of a deep copy
+            buffers = self._swap_episode_buffers()
+            # Randomly assign split (90% train, 10% val)
+            split_dir = self._split_folders[self._select_split()]
+            filename = f"episode_{episode_number:05d}.npz"
+            save_path = os.path.join(split_dir, filename)
+
+            # Blocks while SAVE_QUEUE_SIZE episodes are still being saved
+            self._save_slots.acquire()
+            self._save_futures = [f for f in self._save_futures if not f.done()]
+            self._save_futures.append(
+                self._saver_pool.submit(self._save_episode, episode_number, save_path, buffers, self._episode_len))
+            depth = len(self._save_futures)
+            if depth > self.save_queue_high_water:
+                self.save_queue_high_water = depth
+            logger.debug_at_level(DEBUG_L1, "DepthCollector",
+                                  f"Episode saves in flight: {depth} (high-water: {self.save_queue_high_water})")
         else:
             logger.warning("DepthCollector", f"No data collected for episode {episode_number}")
         
         # Reset for next episode
         self.collecting_episode = False
-        self.episode_depths = []
-        self.episode_poses = []
-        self.episode_frames = []
-        self.episode_distances = []
-        self.episode_actions = []
-        self.episode_victim_dirs = []
-
-        # Unsubscribe from simulation frame events to avoid errors if scene is reset
-        EM.unsubscribe('simulation/frame', self._on_simulation_frame)
-        logger.debug_at_level(DEBUG_L1, "DepthCollector", "Unsubscribed from simulation/frame after episode end")
-
-    def _on_simulation_frame(self, _):
-        """
-        Handle simulation frame event: capture data every save_every_n_frames for episodes
-        """
-        self.global_frame_counter += 1
-        distance = capture_distance_to_victim()
+        self._episode_len = 0
 
-        if not self.collecting_episode or (self.global_frame_counter % self.save_every_n_frames != 0):
-            return
+        # Drop the frame subscription if frame-logging is not active either
+        self._update_frame_subscription()
 
-        logger.debug_at_level(DEBUG_L2, "DepthCollector",
-                              f"Capturing episode data for frame {self.global_frame_counter}")
-
-        # determine current action as ActionLabel enum
-        action_enum = get_action_label()
-        self.last_action_label = action_enum
-
-        logger.info("DepthCollector", f"Action: {action_enum.name} ({action_enum.value})")
+    def _select_split(self):
+        """
+        Return the split name ('train' or 'val') for the next saved episode.
+        """
+        if self._split_idx == SPLIT_DRAW_BLOCK:
+            self._split_choices = self._draw_splits()
+            self._split_idx = 0
+        split = SPLIT_NAMES[self._split_choices[self._split_idx]]
+        self._split_idx += 1
+        return split
+
+    def _draw_splits(self):
+        """
+        Draw the split indices for the next SPLIT_DRAW_BLOCK saved episodes.
+        """
+        return self._split_rng.choice(len(SPLIT_NAMES), size=SPLIT_DRAW_BLOCK, p=SPLIT_PROBABILITIES).tolist()
 
-        # capture sensor data
-        depth_img = capture_depth(self.sensor_handle)
-        pose      = capture_pose()
+    def _allocate_episode_buffers(self, capacity, depth_shape=None):
+        """
+        Allocate fresh episode arrays with room for `capacity` captures; a depth buffer is
+        only allocated once the frame shape is known.
+        """
+        self._set_episode_buffers({
+            'depths': None if depth_shape is None else np.empty((capacity,) + depth_shape, dtype=self.depth_dtype),
+            'poses': np.empty((capacity, 6), dtype=np.float32),
+            'frames': np.empty(capacity, dtype=np.int32),
+            'distances': np.empty(capacity, dtype=np.float32),
+            'actions': np.empty(capacity, dtype=np.uint8),
+            'victim_dirs': np.empty((capacity, 4), dtype=np.float32),
+        })
 
-        # get victim direction (no try/except around sim calls)
-        unit_vec, vic_dist = get_victim_direction()
-        victim_vec = (*unit_vec, vic_dist)
+    def _set_episode_buffers(self, buffers):
+        """
+        Make `buffers` (field name -> array, as saved in the .npz) the active episode arrays.
+        """
+        self.episode_depths = buffers['depths']
+        self.episode_poses = buffers['poses']
+        self.episode_frames = buffers['frames']
+        self.episode_distances = buffers['distances']
+        self.episode_actions = buffers['actions']
+        self.episode_victim_dirs = buffers['victim_dirs']
+
+    def _swap_episode_buffers(self):
+        """
+        Detach the filled episode arrays for saving and continue on a set returned to the pool
+        by a finished save, or on a new one if none is free yet (double buffering).
+        """
+        buffers = {
+            'depths': self.episode_depths,
+            'poses': self.episode_poses,
+            'frames': self.episode_frames,
+            'distances': self.episode_distances,
+            'actions': self.episode_actions,
+            'victim_dirs': self.episode_victim_dirs,
+        }
+        try:
+            self._set_episode_buffers(self._buffer_pool.get_nowait())
+        except queue.Empty:
+            self._allocate_episode_buffers(len(self.episode_poses), self.episode_depths.shape[1:])
+        return buffers
 
-        # append all buffers
-        self.episode_depths.append(depth_img)
-        self.episode_poses.append(pose)
-        self.episode_frames.append(self.global_frame_counter)
-        self.episode_distances.append(distance)
-        self.episode_actions.append(action_enum)
-        self.episode_victim_dirs.append(victim_vec)
+    def _next_episode_row(self):
+        """
+        Reserve the next row of the preallocated episode arrays, doubling them when full.
+        """
+        row = self._episode_len
+        if row == len(self.episode_poses):
+            self.episode_poses = _grow_buffer(self.episode_poses)
+            self.episode_frames = _grow_buffer(self.episode_frames)
+            self.episode_distances = _grow_buffer(self.episode_distances)
+            self.episode_victim_dirs = _grow_buffer(self.episode_victim_dirs)
+            self.episode_actions = _grow_buffer(self.episode_actions)
+            if self.episode_depths is not None:
+                self.episode_depths = _grow_buffer(self.episode_depths)
+        self._episode_len += 1
+        return row
+
+    def _update_frame_subscription(self):
+        """
+        Keep exactly one simulation/frame subscription while capture or frame-logging is active.
+        """
+        needed = self.collecting_episode or self.logging_active
+        if needed and not self._frame_subscribed:
+            EM.subscribe('simulation/frame', self._on_frame)
+            self._frame_subscribed = True
+            logger.debug_at_level(DEBUG_L1, "DepthCollector", "Subscribed to simulation/frame")
+        elif not needed and self._frame_subscribed:
+            EM.unsubscribe('simulation/frame', self._on_frame)
+            self._frame_subscribed = False
+            logger.debug_at_level(DEBUG_L1, "DepthCollector", "Unsubscribed from simulation/frame")
+
+    def _on_frame(self, _):
+        """
+        Handle simulation frame event: advance the action label, log the drone state while the
+        scene is active (verbose only) and capture episode data every save_every_n_frames.
+        Pose, distance and action label are read once and shared by both paths.
+        """
+        self.global_frame_counter += 1
+        capture = False
+        if self.collecting_episode and not self._episode_failed:
+            self._ticks_until_capture -= 1
+            if not self._ticks_until_capture:
+                self._ticks_until_capture = self.save_every_n_frames
+                capture = True
+        # The action label keeps state between calls (hover debounce, yaw change), so it
+        # advances on every frame, not only on captured or logged ones
+        action_enum = get_action_label(self._quad_handle, self._victim_handle)
+        log = self.logging_active and self.verbose
+        if not (capture or log):
+            return
 
-        logger.info("DepthCollector", f"Action: {action_enum.name}, Distance to victim: {distance:.2f}m")
+        if capture:
+            row = self._next_episode_row()
+            pose = capture_pose(out=self.episode_poses[row], quad_handle=self._quad_handle)
+        else:
+            pose = capture_pose(out=self._pose_scratch, quad_handle=self._quad_handle)
+        qx, qy, qz, _, _, yaw = pose.tolist()
+
+        # Victim direction and distance from the captured pose; only the victim position is queried
+        victim_pos = capture_victim_position(self._victim_handle)
+        if yaw != self._trig_yaw:
+            self._trig_yaw = yaw
+            self._cos_yaw, self._sin_yaw = math.cos(yaw), math.sin(yaw)
+        unit_vec, distance = _victim_direction_from((qx, qy, qz), victim_pos, self._cos_yaw, self._sin_yaw)
+
+        if log:
+            self._log_frame(yaw, distance, action_enum)
+        if capture:
+            self._capture_frame(row, unit_vec, distance, action_enum)
+
+    def _capture_frame(self, row, unit_vec, distance, action_enum):
+        """
+        Complete episode row `row` (pose already written) from the shared per-frame readings.
+        """
         logger.debug_at_level(DEBUG_L2, "DepthCollector",
-                              f"Episode {self.current_episode_number} - captured data - "
-                              f"distance: {distance:.2f}, action: {action_enum.name}")
-
-        EM.publish(DATASET_CAPTURE_COMPLETE, {
-            'frame': self.global_frame_counter,
-            'distance': distance,
-            'action': action_enum.name,
-            'victim_vec': victim_vec
-        })
+                              "Capturing episode data for frame %d", self.global_frame_counter)
+
+        self.last_action_label = action_enum.value
+
+        if self.verbose:
+            logger.info("DepthCollector", f"Action: {action_enum.name} ({action_enum.value})")
+
+        # capture sensor data straight into the episode depth buffer
+        depths = self.episode_depths
+        depth_img = capture_depth(self.sensor_handle, out=None if depths is None else depths[row])
+        if depths is None or depth_img.shape != depths.shape[1:]:
+            if row:
+                # A frame of another shape (e.g. a failed capture) can't share the buffer with the
+                # rows already captured; reallocating would zero them, so the episode is dropped
+                logger.error("DepthCollector",
+                             f"Depth frame shape {depth_img.shape} does not match episode shape "
+                             f"{depths.shape[1:]}; episode {self.current_episode_number} will not be saved")
+                self._episode_failed = True
+                return
+            # First capture of the episode: (re)allocate the depth buffer for the sensor resolution
+            self.episode_depths = np.zeros((len(self.episode_poses),) + depth_img.shape, dtype=self.depth_dtype)
+            self.episode_depths[row] = depth_img
+
+        victim_vec = self.episode_victim_dirs[row]
+        victim_vec[:3] = unit_vec
+        victim_vec[3] = distance
+
+        self.episode_frames[row] = self.global_frame_counter
+        self.episode_distances[row] = distance
+        # Save actions as integer codes
+        self.episode_actions[row] = action_enum.value
+
+        if self.verbose:
+            logger.info("DepthCollector", f"Action: {action_enum.name}, Distance to victim: {distance:.2f}m")
+        if logger.is_enabled(DEBUG_L2):
+            logger.debug_at_level(DEBUG_L2, "DepthCollector",
+                                  "Episode %d - captured data - distance: %.2f, action: %s",
+                                  self.current_episode_number, distance, action_enum.name)
+
+        _CAPTURE_EVENT['frame'] = self.global_frame_counter
+        _CAPTURE_EVENT['distance'] = distance
+        _CAPTURE_EVENT['action'] = action_enum.name
+        _CAPTURE_EVENT['victim_vec'] = victim_vec
+        EM.publish(DATASET_CAPTURE_COMPLETE, _CAPTURE_EVENT)
 
     def shutdown(self):
         """Shutdown the data collector."""
@@ -305,57 +427,59 @@ class DepthDatasetCollector:
         if self.collecting_episode:
             logger.info("DepthCollector", "Ending active episode during shutdown")
             self.collecting_episode = False
-        # Wait for all save threads to finish
-        for t in self._save_threads:
-            logger.info("DepthCollector", f"Waiting for save thread {t.name} to finish...")
-            t.join()
-        logger.info("DepthCollector", "All episode save threads have completed.")
-
-    def _safe_stack(self, name, arr_list, dtype=None):
-        """Safely stack arrays with error handling."""
+        # Wait for pending saves, then stop the saver pool
+        pending = sum(1 for f in self._save_futures if not f.done())
+        logger.info("DepthCollector", f"Waiting for {pending} pending episode save(s) to finish...")
+        self._saver_pool.shutdown(wait=True)
+        logger.info("DepthCollector", "All episode saves have completed.")
+
+    def _save_episode(self, episode_number, save_path, buffers, n):
+        """
+        Save the first `n` rows of an episode buffer set on a saver pool thread, then return
+        the set to the buffer pool and free the save slot.
+        """
+        # Save the dataset (only this I/O is caught)
         try:
-            if not arr_list:
-                logger.warning("DepthCollector", f"Empty list for {name}, skipping")
-                return None
-            return np.stack(arr_list) if dtype is None else np.stack(arr_list).astype(dtype)
+            write_npz_compressed(save_path, {name: array[:n] for name, array in buffers.items()})
+            logger.info("DepthCollector", f"[Async] Successfully saved episode {episode_number} to {save_path}")
+            EM.publish(EPISODE_SAVE_COMPLETED, {'episode_number': episode_number})
         except Exception as e:
-            logger.error("DepthCollector", f"Error stacking {name}: {e}")
-            return None
+            logger.error("DepthCollector", f"[Async] Failed to save episode {episode_number} to {save_path}: {e}")
+            EM.publish(EPISODE_SAVE_ERROR, {'episode_number': episode_number})
+        finally:
+            self._buffer_pool.put(buffers)
+            self._save_slots.release()
 
-    def _on_config_updated(self, _):
+    def _on_config_updated(self, key):
         """Update configuration settings."""
+        if key not in (None, 'verbose'):
+            return  # Only the verbose flag is read here
         config = get_default_config()
         self.verbose = config.get('verbose', False)
         logger.debug_at_level(DEBUG_L1, "DepthCollector", f"Configuration updated, verbose: {self.verbose}")
 
     def _on_scene_created(self, _):
-        """Handle scene creation event: enable frame-logging"""
+        """Handle scene creation event: cache scene object handles and enable frame-logging"""
         logger.info("DepthCollector", "Scene created: starting frame-logging")
+        self._quad_handle = SC.sim.getObject('/Quadcopter')
+        self._victim_handle = SC.sim.getObject('/Victim')
         self.logging_active = True
-        EM.subscribe('simulation/frame', self._on_frame_logging)
+        self._update_frame_subscription()
 
     def _on_scene_cleared(self, _):
         """Handle scene cleared event: disable frame-logging"""
         logger.info("DepthCollector", "Scene cleared: stopping frame-logging")
+        self._quad_handle = self._victim_handle = None
         self.logging_active = False
-        EM.unsubscribe('simulation/frame', self._on_frame_logging)
+        self._update_frame_subscription()
 
-    def _on_frame_logging(self, _):
-        """Log drone action and state each simulation frame when active"""
-        if not getattr(self, 'logging_active', False):
-            return
-        # Drone state
-        pose = capture_pose()
-        yaw = pose[5]
-        distance = capture_distance_to_victim()
+    def _log_frame(self, yaw, distance, action_enum):
+        """Log drone action and state from the shared per-frame readings"""
         # Velocity
-        quad = SC.sim.getObject('/Quadcopter')
-        lin_vel, _ = SC.sim.getObjectVelocity(quad)
-        speed = math.sqrt(lin_vel[0]**2 + lin_vel[1]**2 + lin_vel[2]**2)
-        # Action label
-        action_enum = get_action_label()
+        lin_vel, _ = SC.sim.getObjectVelocity(self._quad_handle)
+        speed = math.hypot(lin_vel[0], lin_vel[1], lin_vel[2])
         logger.info(
             "DepthCollector",
             f"FrameLog | Action: {action_enum.name} ({action_enum.value}) | Dist: {distance:.2f}m | "
             f"Yaw: {math.degrees(yaw):.1f}° | Speed: {speed:.2f}m/s"
-        )
\ No newline at end of file
+        )
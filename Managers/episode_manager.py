@@ -2,7 +2,7 @@
 
 import os
 from Utils.log_utils import get_logger, DEBUG_L1, DEBUG_L2
-from Utils.episode_utils import check_episode_end_condition, save_episode_data, EPISODE_START, EPISODE_END, EPISODE_SAVE_COMPLETED, EPISODE_SAVE_ERROR
+from Utils.episode_utils import EPISODE_START, EPISODE_END
 from Core.event_manager import EventManager
 from Managers.scene_manager import SCENE_CREATION_COMPLETED
 
@@ -36,21 +36,12 @@ class EpisodeManager:
         self.threshold = threshold
         self.episode_active = False
         self.episode_number = 0
-        self.episode_data = {
-            'depths': [],
-            'poses': [],
-            'frames': [],
-            'distances': [],
-            'actions': [],
-            'victim_dirs': []
-        }
         self._scene_config = None  # Store config for scene restarts
         
         logger.info("EpisodeManager", f"Initialized with threshold: {threshold}m")
         
         # Subscribe to events
         EM.subscribe(SCENE_CREATION_COMPLETED, self._on_scene_completed)
-        EM.subscribe('simulation/frame', self._on_simulation_frame)
         EM.subscribe('dataset/capture/complete', self._on_data_captured)
         EM.subscribe(EPISODE_MANUAL_END, self._on_manual_end)
         
@@ -85,16 +76,6 @@ class EpisodeManager:
         self.episode_number += 1
         self.episode_active = True
         
-        # Reset episode data
-        self.episode_data = {
-            'depths': [],
-            'poses': [],
-            'frames': [],
-            'distances': [],
-            'actions': [],
-            'victim_dirs': []
-        }
-        
         logger.info("EpisodeManager", f"Episode {self.episode_number} started")
         
         # Publish episode start event
@@ -102,21 +83,11 @@ class EpisodeManager:
             'episode_number': self.episode_number
         })
     
-    def _on_simulation_frame(self, _):
-        """
-        Check for episode end condition each frame.
-        """
-        if not self.episode_active:
-            return
-        
-        # Check if episode should end based on threshold
-        if check_episode_end_condition(self.threshold):
-            logger.info("EpisodeManager", f"Episode {self.episode_number} ending - drone reached victim")
-            self._end_episode()
-    
     def _on_data_captured(self, data):
         """
-        Collect data from each frame capture.
+        End the episode once a frame capture reports the drone within the threshold
+        distance of the victim.
+        The depth dataset collector handles the actual data collection.
         """
         if not self.episode_active:
             return
@@ -125,14 +96,16 @@ class EpisodeManager:
         frame = data.get('frame', 0)
         distance = data.get('distance', -1.0)
         action = data.get('action', 8)  # Default: hover
-        victim_vec = data.get('victim_vec', (0.0, 0.0, 0.0, 0.0))
         
-        # Note: We don't have direct access to depth and pose data here
-        # The depth dataset collector will handle the actual data collection
-        # This is just for episode management
+        logger.debug_at_level(DEBUG_L2, "EpisodeManager",
+                            "Episode %d frame %d: distance=%.2fm, action=%s",
+                            self.episode_number, frame, distance, action)
         
-        logger.debug_at_level(DEBUG_L2, "EpisodeManager", 
-                            f"Episode {self.episode_number} frame {frame}: distance={distance:.2f}m, action={action}")
+        # Check if episode should end based on threshold (distance is -1.0 if the event carried none)
+        if 0 < distance <= self.threshold:
+            logger.info("EpisodeManager", f"Drone within threshold ({self.threshold}m) of victim: {distance:.2f}m")
+            logger.info("EpisodeManager", f"Episode {self.episode_number} ending - drone reached victim")
+            self._end_episode()
     
     def _on_manual_end(self, _):
         """
@@ -211,7 +184,6 @@ class EpisodeManager:
             self.episode_active = False
         # Unsubscribe from events
         EM.unsubscribe(SCENE_CREATION_COMPLETED, self._on_scene_completed)
-        EM.unsubscribe('simulation/frame', self._on_simulation_frame)
         EM.unsubscribe('dataset/capture/complete', self._on_data_captured)
         EM.unsubscribe(EPISODE_MANUAL_END, self._on_manual_end)
         logger.info("EpisodeManager", "Episode manager shutdown complete")
@@ -1,6 +1,8 @@
+import os
+import queue
 import threading
-import time
 import sys
+from collections import deque
 from Core.event_manager import EventManager
 from Utils.log_utils import get_logger, DEBUG_L1, DEBUG_L2, DEBUG_L3
 
@@ -9,15 +11,21 @@ logger = get_logger()
 
 class KeyboardManager:
     _instance = None
+    _instance_lock = threading.Lock()
     
     @classmethod
     def get_instance(cls):
         """
         Get or create the singleton KeyboardManager instance.
         """
-        if cls._instance is None:
-            cls._instance = KeyboardManager()
-        return cls._instance
+        instance = cls._instance
+        if instance is None:
+            # Double-checked so racing first callers cannot open the console twice
+            with cls._instance_lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = KeyboardManager()
+        return instance
     
     def __init__(self):
         # Ensure only one instance is created
@@ -27,64 +35,114 @@ class KeyboardManager:
         self.running = True
         self.typing_mode = False      # only used as a flag
         self.key_pressed = None
-        self.last_command = None
+        # Keys read from the console, published on the main thread by dispatch_pending_keys()
+        self._pending_keys = deque()
+        # Typed commands handed from the input side to get_command() callers
+        self._commands = queue.SimpleQueue()
+        # Unix: stdin is polled from the main loop through a selector; no reader thread
+        self._selector = None
+        self._stdin_fd = None
+        self._old_tty_settings = None
+        self._decoder = None
+        self.thread = None
 
         logger.info("KeyboardManager", "Initializing keyboard manager")
-        self.thread = threading.Thread(target=self._keyboard_loop, daemon=True)
-        self.thread.start()
-        logger.debug_at_level(DEBUG_L1, "KeyboardManager", "Keyboard monitoring thread started")
+        try:
+            import msvcrt  # Windows
+            # Console input cannot be selected on Windows, so it keeps a blocking reader thread
+            self.thread = threading.Thread(target=self._windows_keyboard_loop, args=(msvcrt,), daemon=True)
+            self.thread.start()
+            logger.debug_at_level(DEBUG_L1, "KeyboardManager", "Keyboard monitoring thread started")
+        except ImportError:
+            self._open_unix_keyboard()
         
         KeyboardManager._instance = self
 
-    def _keyboard_loop(self):
+    def _windows_keyboard_loop(self, msvcrt):
+        logger.debug_at_level(DEBUG_L1, "KeyboardManager", "Using Windows keyboard input method")
+        while self.running:
+            # Blocks until a key is pressed instead of polling kbhit()
+            key = msvcrt.getwch()
+            if not self.running:
+                break
+            self.key_pressed = key
+            logger.debug_at_level(DEBUG_L3, "KeyboardManager", "Key pressed: %r", key)
+            self._pending_keys.append(key)
+
+    def _open_unix_keyboard(self):
+        import codecs
+        import selectors
+        import termios
+        import tty
+        logger.debug_at_level(DEBUG_L1, "KeyboardManager", "Using Unix keyboard input method")
         try:
-            import msvcrt  # Windows
-            logger.debug_at_level(DEBUG_L1, "KeyboardManager", "Using Windows keyboard input method")
-            while self.running:
-                if msvcrt.kbhit():
-                    key = msvcrt.getch().decode('utf-8')
-                    self.key_pressed = key
-                    logger.debug_at_level(DEBUG_L3, "KeyboardManager", f"Key pressed: {repr(key)}")
-                    EM.publish('keyboard/key_pressed', key)
-                time.sleep(0.01)
-        except ImportError:
-            # Unix-like system
-            import tty
-            import termios
-            import select
-            logger.debug_at_level(DEBUG_L1, "KeyboardManager", "Using Unix keyboard input method")
             fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
-            try:
-                tty.setraw(fd)
-                while self.running:
-                    dr, _, _ = select.select([sys.stdin], [], [], 0.1)
-                    if dr:
-                        key = sys.stdin.read(1)
-                        self.key_pressed = key
-                        logger.debug_at_level(DEBUG_L3, "KeyboardManager", f"Key pressed: {repr(key)}")
-                        EM.publish('keyboard/key_pressed', key)
-                    time.sleep(0.01)
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-                logger.debug_at_level(DEBUG_L1, "KeyboardManager", "Restored terminal settings")
+            self._old_tty_settings = termios.tcgetattr(fd)
+            tty.setraw(fd)
+        except (OSError, ValueError, termios.error) as e:
+            logger.warning("KeyboardManager", f"Keyboard input unavailable: {e}")
+            return
+        self._stdin_fd = fd
+        self._decoder = codecs.getincrementaldecoder(sys.stdin.encoding or 'utf-8')(errors='replace')
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
 
-    def in_typing_mode(self):
-        return self.typing_mode
+    def _read_unix_keys(self):
+        """
+        Move whatever stdin has ready into the pending-key queue without blocking.
+        """
+        log_keys = logger.is_enabled(DEBUG_L3)
+        select, decode, append = self._selector.select, self._decoder.decode, self._pending_keys.append
+        while select(0):
+            data = os.read(self._stdin_fd, 64)
+            if not data:
+                # stdin closed; stop polling it
+                self._close_unix_keyboard()
+                return
+            for key in decode(data):
+                self.key_pressed = key
+                if log_keys:
+                    logger.debug_at_level(DEBUG_L3, "KeyboardManager", "Key pressed: %r", key)
+                append(key)
+
+    def _close_unix_keyboard(self):
+        import termios
+        if self._selector is None:
+            return
+        self._selector.close()
+        self._selector = None
+        termios.tcsetattr(self._stdin_fd, termios.TCSADRAIN, self._old_tty_settings)
+        logger.debug_at_level(DEBUG_L1, "KeyboardManager", "Restored terminal settings")
+
+    def dispatch_pending_keys(self):
+        """
+        Publish every key read since the last call; run from the main loop.
+        """
+        if self._selector is not None:
+            self._read_unix_keys()
+        pending = self._pending_keys
+        if not pending:
+            return
+        publish, popleft = EM.publish, pending.popleft
+        while pending:
+            publish('keyboard/key_pressed', popleft())
 
     def finish_typing(self, command):
-        self.last_command = command
+        self._commands.put(command)
         self.typing_mode = False
-        logger.debug_at_level(DEBUG_L2, "KeyboardManager", f"Typing mode finished, command: {command}")
+        logger.debug_at_level(DEBUG_L2, "KeyboardManager", "Typing mode finished, command: %s", command)
 
     def get_command(self):
-        cmd = self.last_command
-        self.last_command = None
-        return cmd
+        try:
+            return self._commands.get_nowait()
+        except queue.Empty:
+            return None
 
     def stop(self):
         logger.info("KeyboardManager", "Stopping keyboard manager")
         self.running = False
-        if self.thread.is_alive():
-            self.thread.join()
-            logger.debug_at_level(DEBUG_L1, "KeyboardManager", "Keyboard thread joined successfully")
+        self._close_unix_keyboard()
+        if self.thread is not None and self.thread.is_alive():
+            # The Windows reader is blocked in getwch(), which nothing but a key press can wake;
+            # waiting for it only delays shutdown. It is a daemon and exits with the process.
+            logger.debug_at_level(DEBUG_L1, "KeyboardManager", "Keyboard thread left to exit with the process")
@@ -19,7 +19,7 @@ class MenuManager:
         if menu is None:
             logger.warning("MenuManager", f"Menu '{name}' not found")
         else:
-            logger.debug_at_level(DEBUG_L2, "MenuManager", f"Retrieved menu: '{name}'")
+            logger.debug_at_level(DEBUG_L2, "MenuManager", "Retrieved menu: '%s'", name)
         return menu
 
     def show_menu(self, name: str):
@@ -1,15 +1,14 @@
 # Managers/menu_system.py
 
+import time
 import tkinter as tk
 from tkinter import ttk
-import logging
-from Utils.config_utils import CONFIG_GROUPS, parse_coordinate_tuple
-from Utils.scene_utils import restart_disaster_area
+from Utils.config_utils import CONFIG_GROUPS, FIELD_BY_KEY, parse_coordinate_tuple
 from Utils.log_utils import get_logger, LOG_LEVEL_DEBUG, LOG_LEVEL_INFO, LOG_LEVEL_WARNING, LOG_LEVEL_ERROR, LOG_LEVEL_CRITICAL
 from Managers.scene_manager import (
     create_scene, clear_scene, cancel_scene_creation,
-    SCENE_START_CREATION, SCENE_CREATION_PROGRESS, 
-    SCENE_CREATION_COMPLETED, SCENE_CREATION_CANCELED
+    SCENE_CREATION_PROGRESS, 
+    SCENE_CREATION_COMPLETED, SCENE_CREATION_CANCELED, SCENE_CLEARED
 )
 
 from Managers.Connections.sim_connection import SimConnection
@@ -18,8 +17,25 @@ SC = SimConnection.get_instance()
 from Core.event_manager import EventManager
 EM = EventManager.get_instance()
 
+# Minimum time between Tk event-loop pumps driven by simulation frames (~30 Hz)
+UI_UPDATE_INTERVAL = 1.0 / 30
+
+# Victim readings arriving faster than this are collapsed into the latest one
+VICTIM_INDICATOR_INTERVAL_MS = 50
+
+# Edits within this window are published as one 'config/updated' per changed key
+CONFIG_PUBLISH_DELAY_MS = 150
+
 
 class MenuSystem:
+    # Scene tab buttons: (label, name of the MenuSystem method they call)
+    SCENE_BUTTONS = (
+        ("Create Environment", "_create_scene_clicked"),
+        ("Clear Environment", "_clear_scene_clicked"),
+        ("Cancel Creating Environment", "_cancel_creation_clicked"),
+        ("End Episode", "_end_episode_clicked"),
+    )
+
     def __init__(self, config: dict, sim_command_queue):
         self.sim_queue = sim_command_queue
         self.sim = SC.sim
@@ -27,15 +43,39 @@ class MenuSystem:
         # Map to hold config UI variables and widgets
         self._config_vars = {}
         self._config_widgets = {}
+        # Tk variable name -> config key, for the shared checkbox trace callback
+        self._var_to_key = {}
+        # Entry widget -> config key, for the shared entry commit callback
+        self._entry_to_key = {}
+        # Keys changed since the last 'config/updated' flush (insertion-ordered, no duplicates)
+        self._pending_config_keys = {}
+        self._config_publish_after = None
+        # True while _on_config_updated_gui writes config values back into the widgets
+        self._syncing = False
         # Store verbose setting for easy access
         self.verbose = config.get('verbose', False)
         # Get logger instance
         self.logger = get_logger()
 
+        # (topic, callback) pairs subscribed through _sub, released together in cleanup
+        self._subs = []
         # Subscribe to config updates to sync UI
-        EM.subscribe('config/updated', self._on_config_updated_gui)
+        self._sub('config/updated', self._on_config_updated_gui)
 
-        self.progress_var = None  # For progress bar
+        self.progress_bar = None  # For scene creation progress
+        # Monotonic time of the last root.update(); frame-driven pumps are rate-limited
+        self._last_ui_update = 0.0
+        # Latest scene progress event and the pending idle callback that will display it
+        self._latest_progress = None
+        self._progress_after = None
+        # Whole percent and status text last shown for scene progress, so repeats are skipped
+        self._shown_percent = None
+        self._shown_progress_message = None
+        # Latest victim reading and the pending timer that will display it
+        self._latest_victim_vec = None
+        self._victim_after = None
+        # Pending timer that hides the notification popup
+        self._notification_after = None
 
         # Build and style main window
         self.root = tk.Tk()
@@ -60,43 +100,61 @@ class MenuSystem:
             self.logger.verbose_log("MenuSystem", "Registering event handlers")
             
         # Scene creation events
-        EM.subscribe(SCENE_CREATION_PROGRESS, self._on_scene_progress)
-        EM.subscribe(SCENE_CREATION_COMPLETED, self._on_scene_completed)
-        EM.subscribe(SCENE_CREATION_CANCELED, self._on_scene_canceled)
+        self._sub(SCENE_CREATION_PROGRESS, self._on_scene_progress)
+        self._sub(SCENE_CREATION_COMPLETED, self._on_scene_completed)
+        self._sub(SCENE_CREATION_CANCELED, self._on_scene_canceled)
+        self._sub(SCENE_CLEARED, self._on_scene_cleared)
         
         # Handle scene creation requests from menus
-        EM.subscribe('scene/creation/request', self._on_scene_creation_request)
-        EM.subscribe('simulation/frame', self._on_simulation_frame)
-        EM.subscribe('simulation/shutdown', self.cleanup)
+        self._sub('scene/creation/request', self._on_scene_creation_request)
+        self._sub('simulation/frame', self._on_simulation_frame)
+        self._sub('simulation/shutdown', self.cleanup)
         
         # Subscribe to UI update trigger
-        EM.subscribe('trigger_ui_update', self._force_ui_update)
+        self._sub('trigger_ui_update', self._force_ui_update)
         
         # Subscribe to dataset capture complete for victim distance updates
-        EM.subscribe('dataset/capture/complete', self._update_victim_indicator)
+        self._sub('dataset/capture/complete', self._update_victim_indicator)
         
         if self.verbose:
             self.logger.verbose_log("MenuSystem", "Event handlers registered")
 
+    def _sub(self, topic, callback):
+        """Subscribe callback to topic and remember the pair for cleanup"""
+        EM.subscribe(topic, callback)
+        self._subs.append((topic, callback))
+
+    def _pump_ui(self):
+        """Run the Tk event loop once, at most every UI_UPDATE_INTERVAL seconds"""
+        now = time.monotonic()
+        if now - self._last_ui_update < UI_UPDATE_INTERVAL:
+            return
+        self._last_ui_update = now
+        self.root.update()
+
     def _force_ui_update(self, _):
-        """Force the UI to update immediately"""
+        """Let the UI catch up during long operations such as scene creation"""
         try:
-            self.root.update()
-        except Exception as e:
-            if hasattr(self, 'verbose') and self.verbose:
+            self._pump_ui()
+        except tk.TclError as e:
+            # Raised once the window has been destroyed
+            if self.verbose:
                 self.logger.error("MenuSystem", f"Error updating UI: {e}")
 
     def _on_simulation_frame(self, _):
         """Wrapper method to handle simulation frame events and update the UI safely"""
         try:
-            self.root.update()
-        except Exception as e:
+            self._pump_ui()
+        except tk.TclError as e:
+            # Raised once the window has been destroyed
             self.logger.error("MenuSystem", f"Error updating UI: {e}")
 
     def _build_ui(self):
         # Themed notebook for Scene and Config tabs
         style = ttk.Style(self.root)
-        style.theme_use('clam')
+        # Applying a theme restyles every ttk widget, so only switch when not already active
+        if style.theme_use() != 'clam':
+            style.theme_use('clam')
         notebook = ttk.Notebook(self.root)
         notebook.pack(expand=True, fill="both")
         
@@ -105,112 +163,135 @@ class MenuSystem:
         notebook.add(scene_tab, text="Scene")
         self._build_scene_tab(scene_tab)
         
-        # Config tab
+        # Config tab (built the first time it is selected)
         config_tab = ttk.Frame(notebook, padding=5)  # Reduced padding to maximize space
         notebook.add(config_tab, text="Config")
-        self._build_config_tab(config_tab)
         
-        # Status tab with victim indicator
+        # Status tab with victim indicator (built the first time it is selected)
         status_tab = ttk.Frame(notebook, padding=10)
         notebook.add(status_tab, text="Status")
-        self._build_status_tab(status_tab)
+        self._status_tab = str(status_tab)
+        
+        self._tab_builders = {
+            str(config_tab): self._build_config_tab,
+            str(status_tab): self._build_status_tab,
+        }
+        
+        # Create notification popup for config changes
+        self.notification = tk.Label(self.root, text="", background="#4CAF50", foreground="white",
+                              relief="solid", borderwidth=1, font=("Helvetica", 10), padx=10, pady=5)
+        self.notification.place_forget()  # Hide initially
         
         # Make window resizable
         self.root.resizable(True, True)
         # Set minimum size to prevent UI elements from becoming too cramped
         self.root.minsize(320, 400)
         
-        # Handle tab changes to resize window when switching to Status tab
-        def on_tab_changed(event):
-            tab_id = notebook.index(notebook.select())
-            if tab_id == 2:  # Status tab (0-based index)
-                # Make window larger for Status tab
-                self.root.geometry("400x600")
-            else:
-                # Default size for other tabs
-                self.root.geometry("320x400")
-        
         # Bind the tab change event
-        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        """Build a tab on its first selection and resize the window for the Status tab"""
+        notebook = event.widget
+        selected = notebook.select()
+        builder = self._tab_builders.pop(selected, None)
+        if builder is not None:
+            builder(notebook.nametowidget(selected))
+            if selected == self._status_tab and self._latest_victim_vec is not None:
+                # Show the reading that arrived before the tab existed
+                self._apply_victim_indicator(*self._latest_victim_vec)
+        
+        if selected == self._status_tab:
+            # Make window larger for Status tab
+            self.root.geometry("400x600")
+        else:
+            # Default size for other tabs
+            self.root.geometry("320x400")
 
     def _build_scene_tab(self, parent):
         # Title
         ttk.Label(parent, text="Disaster Simulation Control", font=("Helvetica", 16, "bold")).pack(pady=(0,10))
         
-        # Progress bar for scene creation
-        self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(parent, variable=self.progress_var, maximum=1.0)
+        # Progress bar for scene creation; stays packed and sits at 0 while idle
+        # No linked variable: values are written straight to the widget, skipping a Tcl trace per update
+        self.progress_bar = ttk.Progressbar(parent, maximum=1.0)
         self.progress_bar.pack(fill="x", pady=5)
-        self.progress_bar.pack_forget()  # Hide initially
         
         # Status label
         self.status_label = ttk.Label(parent, text="")
         self.status_label.pack(pady=2)
         
-        # Create scene with event-driven approach
-        def create_scene_with_event():
-            # Apply all config changes first to ensure latest values are used
-            self._apply_all_config_changes()
-            
-            # Disable all buttons during scene creation
-            for btn in self.scene_buttons:
-                if "Cancel" not in btn["text"]:
-                    btn.configure(state="disabled")
-                else:
-                    # Enable the cancel button during scene creation
-                    btn.configure(state="normal")
-            
-            # Show progress bar
-            self.progress_bar.pack(fill="x", pady=5)
-            self.progress_var.set(0.0)
-            self.status_label.configure(text="Creating scene...")
-            
-            # Start scene creation via event system
-            create_scene(self.config)
-        
-        # Restart scene using event-based approach
-        def restart_scene():
-            self.status_label.configure(text="Restarting scene...")
-            restart_disaster_area(self.config)
-            
-        # Clear scene using event-based approach
-        def clear_scene_action():
-            self.status_label.configure(text="Clearing scene...")
-            clear_scene()
-              # Cancel ongoing scene creation 
-        def cancel_creation():
-            self.status_label.configure(text="Canceling scene creation...")
-            cancel_scene_creation()
-            
-        # Manual episode end trigger
-        def trigger_episode_end():
-            from Managers.episode_manager import EpisodeManager
-            episode_manager = EpisodeManager.get_instance()
-            if episode_manager.is_episode_active():
-                episode_manager.trigger_manual_end()
-                self.status_label.configure(text="Episode manually ended")
-            else:
-                self.status_label.configure(text="No active episode to end")
-        
-        # Scene control buttons
-        self.scene_buttons = []
-        for text, command in [
-            ("Create Environment", create_scene_with_event),
-            ("Clear Environment", clear_scene_action),
-            ("Cancel Creating Environment", cancel_creation),
-            ("End Episode", trigger_episode_end),
-        ]:
-            btn = ttk.Button(parent, text=text, command=command)
+        # Scene control buttons; the Cancel button is kept apart from the others,
+        # whose state always flips the opposite way
+        self._cancel_button = None
+        self._scene_action_buttons = []
+        self._creating = False
+        for text, method_name in self.SCENE_BUTTONS:
+            btn = ttk.Button(parent, text=text, command=getattr(self, method_name))
             
             # Initially disable the Cancel button since creation is not in progress
-            if "Cancel" in text:
-                btn.configure(state="disabled")
+            if method_name == "_cancel_creation_clicked":
+                btn.state(("disabled",))
+                self._cancel_button = btn
+            else:
+                self._scene_action_buttons.append(btn)
             btn.pack(fill="x", pady=5)
-            self.scene_buttons.append(btn)
             
         # Quit button
         ttk.Button(parent, text="Quit", command=self._quit).pack(fill="x", pady=(15,0))
 
+    def _create_scene_clicked(self):
+        """Create scene with event-driven approach"""
+        self._begin_scene_creation(self.config)
+    
+    def _begin_scene_creation(self, config):
+        """Apply pending config edits, switch the scene tab to its creating state and start creation"""
+        # Apply all config changes first to ensure latest values are used
+        self._apply_all_config_changes()
+        
+        # Disable all buttons but Cancel during scene creation
+        self._set_creating_state(True)
+        
+        # Start the progress bar from empty
+        self.progress_bar.configure(value=0.0)
+        self.status_label.configure(text="Creating scene...")
+        self._shown_percent = 0
+        self._shown_progress_message = None
+        
+        # Start scene creation via event system
+        create_scene(config)
+    
+    def _set_creating_state(self, creating):
+        """Enable only Cancel while a scene is being created, and everything but Cancel otherwise"""
+        if creating == self._creating:
+            return
+        self._creating = creating
+        # ttk state flags, rather than a full configure() per button
+        action_flags, cancel_flags = (("disabled",), ("!disabled",)) if creating else (("!disabled",), ("disabled",))
+        for btn in self._scene_action_buttons:
+            btn.state(action_flags)
+        self._cancel_button.state(cancel_flags)
+
+    def _clear_scene_clicked(self):
+        """Clear scene using event-based approach"""
+        self.status_label.configure(text="Clearing scene...")
+        clear_scene()
+        
+    def _cancel_creation_clicked(self):
+        """Cancel ongoing scene creation"""
+        self.status_label.configure(text="Canceling scene creation...")
+        cancel_scene_creation()
+        
+    def _end_episode_clicked(self):
+        """Manual episode end trigger"""
+        from Managers.episode_manager import EpisodeManager
+        episode_manager = EpisodeManager.get_instance()
+        if episode_manager.is_episode_active():
+            episode_manager.trigger_manual_end()
+            self.status_label.configure(text="Episode manually ended")
+        else:
+            self.status_label.configure(text="No active episode to end")
+
     def _build_config_tab(self, parent):
         # Create a canvas with scrollbar for the config options
         canvas = tk.Canvas(parent)
@@ -234,49 +315,26 @@ class MenuSystem:
         # Title
         ttk.Label(scrollable_frame, text="Configuration", font=("Helvetica", 14, "bold")).pack(pady=(0,10))
         
-        # Create notification popup for config changes
-        self.notification = tk.Label(self.root, text="", background="#4CAF50", foreground="white",
-                              relief="solid", borderwidth=1, font=("Helvetica", 10), padx=10, pady=5)
-        self.notification.place_forget()  # Hide initially
-        
         # Create UI for each group
         self._group_frames = {}
         
-        for group in CONFIG_GROUPS:
+        for group_name, rows in CONFIG_FIELD_ROWS:
             # Create group frame
-            group_frame = ttk.LabelFrame(scrollable_frame, text=group["name"])
+            group_frame = ttk.LabelFrame(scrollable_frame, text=group_name)
             group_frame.pack(fill="x", pady=5, padx=5)
+            # One grid per group: labels in column 0, inputs stretching in column 1
+            group_frame.columnconfigure(1, weight=1)
             
             # Add fields to the group
-            for field in group['fields']:
-                key, desc, typ = field['key'], field['desc'], field['type']
-                tooltip = field.get('tooltip', '')
-                
-                frame = ttk.Frame(group_frame)
-                frame.pack(fill="x", pady=2)
-                
+            for row, (key, label_text, tooltip, add_input) in enumerate(rows):
                 # Create label with tooltip
-                label = ttk.Label(frame, text=desc+":", width=20)
-                label.pack(side="left")
+                label = ttk.Label(group_frame, text=label_text, width=20)
+                label.grid(row=row, column=0, sticky="w", pady=2)
                 
                 # Add tooltip functionality
                 self._create_tooltip(label, tooltip)
                 
-                if typ is bool:
-                    var = tk.BooleanVar(value=self.config.get(key, False))
-                    chk = ttk.Checkbutton(frame, variable=var)
-                    chk.pack(side="left")
-                    var.trace_add('write', lambda *_, k=key, v=var: self._update_config(k, v.get()))
-                    widget = chk
-                else:
-                    var = tk.StringVar(value=str(self.config.get(key, '')))
-                    ent = ttk.Entry(frame, textvariable=var)
-                    ent.pack(side="left", fill="x", expand=True)
-                    # Update config on Enter key press
-                    ent.bind('<Return>', lambda e, k=key, v=var: self._update_config(k, v.get()))
-                    # Also update config when field loses focus
-                    ent.bind('<FocusOut>', lambda e, k=key, v=var: self._update_config(k, v.get()))
-                    widget = ent
+                var, widget = add_input(self, group_frame, key, row)
                 
                 # Store for synchronization and feedback
                 self._config_vars[key] = var
@@ -324,12 +382,79 @@ class MenuSystem:
                              command=self._reset_to_defaults)
         reset_btn.pack(fill="x", pady=5)
         
-        # Add mouse wheel scrolling support
-        canvas.bind_all("<MouseWheel>", lambda event: canvas.yview_scroll(int(-1 * (event.delta / 120)), "units"))
-        # For Linux/macOS (different event)
-        canvas.bind_all("<Button-4>", lambda event: canvas.yview_scroll(-1, "units"))
-        canvas.bind_all("<Button-5>", lambda event: canvas.yview_scroll(1, "units"))
+        # Add mouse wheel scrolling support, active only while the pointer is over the config canvas
+        self._config_canvas = canvas
+        self._config_wheel_bindings = []
+        canvas.bind("<Enter>", self._bind_config_wheel)
+        canvas.bind("<Leave>", self._unbind_config_wheel)
+
+    def _bind_config_wheel(self, _):
+        """Route mouse wheel events to the config canvas while the pointer is over it"""
+        if self._config_wheel_bindings:
+            return
+        self._config_wheel_bindings = [
+            ("<MouseWheel>", self.root.bind_all("<MouseWheel>", self._on_config_wheel)),
+            # For Linux/macOS (different event)
+            ("<Button-4>", self.root.bind_all("<Button-4>", self._on_config_wheel_up)),
+            ("<Button-5>", self.root.bind_all("<Button-5>", self._on_config_wheel_down)),
+        ]
+
+    def _unbind_config_wheel(self, event):
+        """Stop routing mouse wheel events once the pointer leaves the config canvas"""
+        try:
+            under_pointer = self.root.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            under_pointer = None
+        # Moving onto a widget inside the canvas also generates <Leave>; keep scrolling then
+        if under_pointer is not None and str(under_pointer).startswith(str(self._config_canvas)):
+            return
+        # Drop the bindings and the Tcl commands tkinter registered for them
+        for sequence, func_id in self._config_wheel_bindings:
+            self.root.unbind_all(sequence)
+            self.root.deletecommand(func_id)
+        self._config_wheel_bindings = []
+
+    def _on_config_wheel(self, event):
+        self._config_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+    def _on_config_wheel_up(self, _):
+        self._config_canvas.yview_scroll(-1, "units")
+
+    def _on_config_wheel_down(self, _):
+        self._config_canvas.yview_scroll(1, "units")
     
+    def _add_bool_input(self, frame, key, row):
+        """Checkbox for a bool config field, gridded into row; returns (variable, widget)"""
+        var = tk.BooleanVar(value=self.config.get(key, False))
+        chk = ttk.Checkbutton(frame, variable=var)
+        chk.grid(row=row, column=1, sticky="w", pady=2)
+        self._var_to_key[str(var)] = key
+        var.trace_add('write', self._on_bool_var_write)
+        return var, chk
+
+    def _add_entry_input(self, frame, key, row):
+        """Text entry for a non-bool config field, gridded into row; returns (variable, widget)"""
+        var = tk.StringVar(value=str(self.config.get(key, '')))
+        ent = ttk.Entry(frame, textvariable=var)
+        ent.grid(row=row, column=1, sticky="ew", pady=2)
+        # Update config on Enter key press and when the field loses focus
+        self._entry_to_key[ent] = key
+        ent.bind('<Return>', self._on_entry_committed)
+        ent.bind('<FocusOut>', self._on_entry_committed)
+        return var, ent
+
+    def _on_bool_var_write(self, var_name, index, mode):
+        """BooleanVar trace callback shared by every config checkbox"""
+        if self._syncing:
+            return
+        key = self._var_to_key[var_name]
+        self._update_config(key, self._config_vars[key].get())
+
+    def _on_entry_committed(self, event):
+        """<Return>/<FocusOut> callback shared by every config entry"""
+        entry = event.widget
+        self._update_config(self._entry_to_key[entry], entry.get())
+
     def _show_notification(self, message, duration=800, success=True):
         """Show a temporary popup notification"""
         # Configure the notification based on success/error
@@ -361,11 +486,14 @@ class MenuSystem:
         # Show the notification
         self.notification.place(x=max(x, 0), y=y)
         
-        # Schedule hiding the notification
-        self.root.after(duration, self._hide_notification)
+        # Schedule hiding the notification; a newer notification restarts the single timer
+        if self._notification_after is not None:
+            self.root.after_cancel(self._notification_after)
+        self._notification_after = self.root.after(duration, self._hide_notification)
     
     def _hide_notification(self):
         """Hide the notification and restore window transparency"""
+        self._notification_after = None
         self.notification.place_forget()
         self.notification.winfo_toplevel().attributes('-alpha', 1.0)  # Restore full opacity
 
@@ -421,6 +549,9 @@ class MenuSystem:
             
         for key, var in self._config_vars.items():
             self._update_config(key, var.get(), show_notification=False)
+        
+        # Publish the changed keys now, as a single update if there are several
+        self._flush_config_updates(bulk=True)
             
         # Update verbose setting for this instance
         self.verbose = self.config.get('verbose', False)
@@ -433,106 +564,98 @@ class MenuSystem:
 
     def _update_config(self, key, value, show_notification=True):
         """Update a configuration value with proper type conversion"""
-        # Find the field definition to get its type
-        field_type = None
-        
-        # Search through all groups to find the field
-        for group in CONFIG_GROUPS:
-            for field in group['fields']:
-                if field['key'] == key:
-                    field_type = field['type']
-                    break
-            if field_type:
-                break
-                
-        if not field_type:
+        field = FIELD_BY_KEY.get(key)
+        if field is None:
             return  # Field not found
             
         try:
-            # Handle special cases
+            # Handle special cases: the clear zone center is typed as "(x, y)"
             if key == "clear_zone_center":
-                # Parse the coordinate tuple
-                try:
-                    new_value = parse_coordinate_tuple(value)
-                    # Only update and show notification if the value has changed
-                    if str(new_value) != str(self.config.get(key, "")):
-                        self.config[key] = new_value
-                        # Visual feedback on success using popup
-                        if show_notification:
-                            self._show_notification(f"Updated: {key}", duration=800)
-                        # Publish the update event
-                        EM.publish('config/updated', key)
-                        
-                        if self.verbose and key == 'verbose':
-                            self.logger.info("MenuSystem", f"Verbose mode {'enabled' if new_value else 'disabled'}")
-                        elif self.verbose:
-                            self.logger.verbose_log("MenuSystem", f"Updated config {key} = {new_value}")
-                except ValueError as e:
-                    # Show error as popup notification
-                    if show_notification:
-                        self._show_notification(f"Error: {str(e)}", duration=1500, success=False)
-                    if self.verbose:
-                        self.logger.error("MenuSystem", f"Error updating {key}: {e}")
-                    return
+                new_value = parse_coordinate_tuple(value)
             else:
-                # Regular type conversion
-                try:
-                    # Convert to the correct type
-                    new_value = field_type(value)
-                    
-                    # Only update and show notification if the value has changed
-                    if new_value != self.config.get(key, None):
-                        old_value = self.config.get(key, None)
-                        self.config[key] = new_value
-                        
-                        # Update verbose setting if that's what changed
-                        if key == 'verbose':
-                            self.verbose = new_value
-                            self.logger.info("MenuSystem", f"Verbose mode {'enabled' if new_value else 'disabled'}")
-                        elif self.verbose:
-                            self.logger.verbose_log("MenuSystem", f"Updated config {key} = {new_value} (was {old_value})")
-                            
-                        # Visual feedback on success using popup
-                        if show_notification:
-                            self._show_notification(f"Updated: {key}", duration=800)
-                        # Publish the update event
-                        EM.publish('config/updated', key)
-                except Exception as e:
-                    # Show error message as popup
-                    if show_notification:
-                        self._show_notification(f"Error: {str(e)}", duration=1500, success=False)
-                    if self.verbose:
-                        self.logger.error("MenuSystem", f"Error updating {key}: {e}")
-        except Exception as e:
+                # Convert to the correct type
+                new_value = field['type'](value)
+        except (TypeError, ValueError) as e:
             # Show error message as popup
             if show_notification:
                 self._show_notification(f"Error: {str(e)}", duration=1500, success=False)
             if self.verbose:
                 self.logger.error("MenuSystem", f"Error updating {key}: {e}")
+            return
+        
+        # Only update and show notification if the value has changed
+        old_value = self.config.get(key, None)
+        if key == "clear_zone_center":
+            # The stored value may still be the default "(x, y)" string
+            changed = str(new_value) != str(self.config.get(key, ""))
+        else:
+            changed = new_value != old_value
+        if not changed:
+            return
+        self.config[key] = new_value
+        
+        # Update verbose setting if that's what changed
+        if key == 'verbose':
+            self.verbose = new_value
+            self.logger.info("MenuSystem", f"Verbose mode {'enabled' if new_value else 'disabled'}")
+        elif self.verbose:
+            self.logger.verbose_log("MenuSystem", f"Updated config {key} = {new_value} (was {old_value})")
+            
+        # Visual feedback on success using popup
+        if show_notification:
+            self._show_notification(f"Updated: {key}", duration=800)
+        # Publish the update event (debounced)
+        self._queue_config_update(key)
+
+    def _queue_config_update(self, key):
+        """Mark a key as changed and schedule one 'config/updated' publish for the burst"""
+        self._pending_config_keys[key] = None
+        if self._config_publish_after is None:
+            self._config_publish_after = self.root.after(CONFIG_PUBLISH_DELAY_MS, self._flush_config_updates)
+
+    def _flush_config_updates(self, bulk=False):
+        """
+        Publish 'config/updated' once for every key changed since the last flush.
+        With bulk=True (every field was just applied) several changes are published as one
+        'config/updated' with key None, which subscribers treat as "reload everything".
+        """
+        if self._config_publish_after is not None:
+            self.root.after_cancel(self._config_publish_after)
+            self._config_publish_after = None
+        keys = list(self._pending_config_keys)
+        self._pending_config_keys.clear()
+        if bulk and len(keys) > 1:
+            EM.publish('config/updated', None)
+            return
+        for key in keys:
+            EM.publish('config/updated', key)
 
     def _on_config_updated_gui(self, key):
         """
         Handle external or internal config updates and sync GUI elements.
         key: the configuration key that was updated.
         """
-        # Update the corresponding variable
-        if key in self._config_vars:
-            var = self._config_vars[key]
-            new_val = self.config.get(key)
-            # Set variable (convert to string for non-bool)
-            if isinstance(var, tk.StringVar):
-                var.set(str(new_val))
+        # Writing the variables fires their traces; _syncing keeps those from re-applying the value
+        self._syncing = True
+        try:
+            # Update the corresponding variable
+            if key in self._config_vars:
+                self._sync_config_var(key, self._config_vars[key])
+                # Don't show notification here as it would duplicate
             else:
-                var.set(bool(new_val))
-            # Don't show notification here as it would duplicate
-        else:
-            # If key is None or unknown, refresh all
-            for k, var in self._config_vars.items():
-                val = self.config.get(k)
-                if isinstance(var, tk.StringVar):
-                    var.set(str(val))
-                else:
-                    var.set(bool(val))
+                # If key is None or unknown, refresh all
+                for k, var in self._config_vars.items():
+                    self._sync_config_var(k, var)
+        finally:
+            self._syncing = False
+
+    def _sync_config_var(self, key, var):
+        """Write config[key] into its UI variable unless the variable already shows it"""
+        new_val = self.config.get(key)
+        # Convert to string for non-bool fields
+        new_val = str(new_val) if isinstance(var, tk.StringVar) else bool(new_val)
+        if var.get() != new_val:
+            var.set(new_val)
 
     def _quit(self):
         # Signal application to quit and close GUI
@@ -554,89 +677,94 @@ class MenuSystem:
                              (completed_objects > 0 and completed_objects % 5 == 0)):
             self.logger.verbose_log("MenuSystem", f"Scene creation progress: {progress:.0%} - {completed_objects}/{total_objects} objects created")
         
-        def update_ui():
-            # Set progress bar value
-            self.progress_var.set(progress)
-            
-            # Format appropriate message based on creation state
-            if current_category == 'complete':
-                message = f"Scene created - {total_objects}/{total_objects} elements"
-            else:
-                # Format the category name nicely (capitalize)
-                category_display = current_category.capitalize()
-                message = f"Creating scene - {category_display}: {completed_objects}/{total_objects} elements"
-            
-            # Update status label
+        # Keep only the latest progress; one idle callback applies it per UI pump
+        self._latest_progress = data
+        if self._progress_after is None:
+            self._progress_after = self.root.after_idle(self._apply_scene_progress)
+
+    def _apply_scene_progress(self):
+        """Show the most recent scene creation progress in the progress bar and status label."""
+        self._progress_after = None
+        data = self._latest_progress
+        current_category = data.get('current_category', '')
+        completed_objects = data.get('completed_objects', 0)
+        total_objects = data.get('total_objects', 0)
+        
+        # Set progress bar value, only when it moves by at least a whole percent
+        progress = data.get('progress', 0.0)
+        percent = int(progress * 100)
+        if percent != self._shown_percent:
+            self._shown_percent = percent
+            self.progress_bar.configure(value=progress)
+        
+        # Format appropriate message based on creation state
+        if current_category == 'complete':
+            message = f"Scene created - {total_objects}/{total_objects} elements"
+        else:
+            # Format the category name nicely (capitalize)
+            category_display = current_category.capitalize()
+            message = f"Creating scene - {category_display}: {completed_objects}/{total_objects} elements"
+        
+        # Update status label
+        if message != self._shown_progress_message:
+            self._shown_progress_message = message
             self.status_label.configure(text=message)
-            
-            # Force the UI to update
-            self.root.update_idletasks()
-            
-        # Schedule UI update in the main thread
-        self.root.after(0, update_ui)
         
+    def _discard_pending_progress(self):
+        """Cancel a scheduled progress display that has not run yet."""
+        if self._progress_after is not None:
+            self.root.after_cancel(self._progress_after)
+            self._progress_after = None
+
     def _on_scene_completed(self, _):
         """Handle scene creation completion."""
         if self.verbose:
             self.logger.verbose_log("MenuSystem", "Scene creation completed successfully")
             
-        def update_ui():
-            self.status_label.configure(text="Scene creation completed!")
-            # Re-enable normal buttons and specifically disable the Cancel button
-            for btn in self.scene_buttons:
-                if "Cancel" in btn["text"]:
-                    btn.configure(state="disabled")  # Disable the cancel button
-                else:
-                    btn.configure(state="normal")  # Enable other buttons
-            self.progress_bar.pack_forget()
+        # The final status replaces any progress update still waiting to be shown
+        self._discard_pending_progress()
         
         # Schedule the update on the main thread
-        self.root.after(0, update_ui)
+        self.root.after(0, self._show_scene_status, "Scene creation completed!", True)
         
     def _on_scene_canceled(self, _):
         """Handle scene creation cancellation."""
         if self.verbose:
             self.logger.verbose_log("MenuSystem", "Scene creation canceled by user")
             
-        def update_ui():
-            self.status_label.configure(text="Scene creation canceled")
-            # Re-enable normal buttons and specifically disable the Cancel button
-            for btn in self.scene_buttons:
-                if "Cancel" in btn["text"]:
-                    btn.configure(state="disabled")  # Disable the cancel button
-                else:
-                    btn.configure(state="normal")  # Enable other buttons
-            self.progress_bar.pack_forget()
+        # The final status replaces any progress update still waiting to be shown
+        self._discard_pending_progress()
+        
+        # Schedule the update on the main thread
+        self.root.after(0, self._show_scene_status, "Scene creation canceled", True)
+
+    def _on_scene_cleared(self, success):
+        """Report the result of a scene clear once the scene manager has finished it."""
+        message = "Scene cleared" if success else "Scene clearing failed"
+        if self.verbose:
+            self.logger.verbose_log("MenuSystem", message)
         
         # Schedule the update on the main thread
-        self.root.after(0, update_ui)
+        self.root.after(0, self._show_scene_status, message)
+
+    def _show_scene_status(self, message, creation_finished=False):
+        """Show a scene status message; once creation has finished, restore the idle controls"""
+        self.status_label.configure(text=message)
+        if creation_finished:
+            # Re-enable normal buttons and specifically disable the Cancel button
+            self._set_creating_state(False)
+            self.progress_bar.configure(value=0.0)
+            # The next creation starts from a fresh bar and label
+            self._shown_percent = None
+            self._shown_progress_message = None
 
     def _on_scene_creation_request(self, config=None):
         """
         Handle a scene creation request from the menu system.
         This gets triggered when the user selects 'Create disaster area' from the main menu.
         """
-        # Apply all configuration changes first
-        self._apply_all_config_changes()
-        
         # Use provided config or fall back to the current config
-        if config is None:
-            config = self.config
-            
-        # Disable buttons except for the Cancel button during scene creation
-        for i, btn in enumerate(self.scene_buttons):
-            if "Cancel" not in btn["text"]:  # Keep the Cancel button enabled
-                btn.configure(state="disabled")
-            else:
-                btn.configure(state="normal")  # Ensure the Cancel button is enabled
-        
-        # Show progress bar
-        self.progress_bar.pack(fill="x", pady=5)
-        self.progress_var.set(0.0)
-        self.status_label.configure(text="Creating scene...")
-        
-        # Start scene creation via event
-        create_scene(config)
+        self._begin_scene_creation(self.config if config is None else config)
 
     def _update_victim_indicator(self, data):
         """Update the victim distance and direction indicator based on capture data"""
@@ -648,138 +776,175 @@ class MenuSystem:
         if len(victim_vec) < 4:
             return
             
-        dx, dy, dz, distance = victim_vec
+        # Keep only the latest reading; one timer shows it (trailing edge)
+        self._latest_victim_vec = tuple(victim_vec[:4])
+        if self._victim_after is not None:
+            return
         
         # Only schedule UI update if root still exists
         if not hasattr(self, 'root') or not self.root.winfo_exists():
             return
         
-        # Update UI safely
-        def update_ui():
-            # Verify that UI elements still exist before updating
-            if not hasattr(self, 'distance_var') or not hasattr(self, 'elevation_var'):
-                return
-                
-            # Update distance text
-            if distance <= 0:
-                self.distance_var.set("Not detected")
-                self.elevation_var.set("Not detected")
-            else:
-                self.distance_var.set(f"{distance:.2f} meters")
-                
-                # Update elevation text with simple numerical format
-                if abs(dz) < 0.1:  # If very close to level
-                    self.elevation_var.set("Same level (±0.1m)")
-                    self.elevation_label.configure(foreground="green")
-                elif dz > 0:
-                    self.elevation_var.set(f"{dz:.2f}m above drone")
-                    # Color based on how much higher (harder to reach)
-                    if dz > 3:
-                        self.elevation_label.configure(foreground="red")
-                    else:
-                        self.elevation_label.configure(foreground="orange")
-                else:  # dz < 0
-                    self.elevation_var.set(f"{abs(dz):.2f}m below drone")
-                    # Color based on how much lower (easier to spot)
-                    if abs(dz) > 3:
-                        self.elevation_label.configure(foreground="orange")
-                    else:
-                        self.elevation_label.configure(foreground="green")
-                
-            # Update direction indicator if canvas still exists
-            if hasattr(self, 'direction_canvas') and self.direction_canvas.winfo_exists():
-                self._draw_direction_indicator(dx, dy, dz)
-            
-            # Update signal strength (inverse of distance)
-            if distance <= 0:
-                self.signal_var.set(0.0)
-            else:
-                # Normalize signal strength: stronger when closer
-                # Maximum strength at 1m, diminishes with distance
-                strength = min(1.0, 1.0 / max(1.0, distance))
-                self.signal_var.set(strength)
-                
-            # Color-code the distance label based on proximity
-            if distance <= 0:
-                self.distance_label.configure(foreground="gray")
-            elif distance < 5.0:
-                self.distance_label.configure(foreground="green")
-            elif distance < 15.0:
-                self.distance_label.configure(foreground="orange")
-            else:
-                self.distance_label.configure(foreground="red")
-        
         # Use a try-except block when scheduling the update
         try:
             # Schedule UI update on the main thread
-            self.root.after(0, update_ui)
+            self._victim_after = self.root.after(VICTIM_INDICATOR_INTERVAL_MS, self._flush_victim_indicator)
         except Exception as e:
             print(f"[MenuSystem] Error scheduling UI update: {e}")
-            
-    def _draw_direction_indicator(self, dx, dy, dz):
-        """Draw a direction indicator on the canvas showing victim direction"""
-        # Clear canvas
-        self.direction_canvas.delete("all")
-        canvas_width = self.direction_canvas.winfo_width()
-        canvas_height = self.direction_canvas.winfo_height()
+
+    def _flush_victim_indicator(self):
+        """Show the most recent victim reading received since the last flush"""
+        self._victim_after = None
+        self._apply_victim_indicator(*self._latest_victim_vec)
+
+    def _apply_victim_indicator(self, dx, dy, dz, distance):
+        """Show a victim reading, touching only the widgets whose text or color changes"""
+        # Verify that UI elements still exist before updating
+        if not hasattr(self, 'distance_var') or not hasattr(self, 'elevation_var'):
+            return
         
-        # Ensure we have minimum dimensions
-        if canvas_width < 20 or canvas_height < 20:
-            canvas_width = canvas_height = 150
+        elevation_color = None  # unchanged unless a victim is detected
+        if distance <= 0:
+            distance_text = elevation_text = "Not detected"
+            distance_color = "gray"
+            strength = 0.0
+        else:
+            distance_text = f"{distance:.2f} meters"
             
-        # Calculate center
-        center_x = canvas_width / 2
-        center_y = canvas_height / 2
-        radius = min(center_x, center_y) - 10
-        
-        # Draw outer circle (radar)
-        self.direction_canvas.create_oval(
-            center_x - radius, center_y - radius, 
-            center_x + radius, center_y + radius, 
-            outline="green", width=2
+            # Elevation text with simple numerical format
+            if abs(dz) < 0.1:  # If very close to level
+                elevation_text = "Same level (±0.1m)"
+                elevation_color = "green"
+            elif dz > 0:
+                elevation_text = f"{dz:.2f}m above drone"
+                # Color based on how much higher (harder to reach)
+                elevation_color = "red" if dz > 3 else "orange"
+            else:  # dz < 0
+                elevation_text = f"{abs(dz):.2f}m below drone"
+                # Color based on how much lower (easier to spot)
+                elevation_color = "orange" if abs(dz) > 3 else "green"
+            
+            # Color-code the distance label based on proximity
+            if distance < 5.0:
+                distance_color = "green"
+            elif distance < 15.0:
+                distance_color = "orange"
+            else:
+                distance_color = "red"
+            
+            # Normalize signal strength: stronger when closer
+            # Maximum strength at 1m, diminishes with distance
+            strength = min(1.0, 1.0 / max(1.0, distance))
+        
+        # Push only what differs from the last reading shown
+        shown = self._victim_shown
+        if shown.get('distance_text') != distance_text:
+            shown['distance_text'] = distance_text
+            self.distance_var.set(distance_text)
+        if shown.get('distance_color') != distance_color:
+            shown['distance_color'] = distance_color
+            self.distance_label.configure(foreground=distance_color)
+        if shown.get('elevation_text') != elevation_text:
+            shown['elevation_text'] = elevation_text
+            self.elevation_var.set(elevation_text)
+        if elevation_color is not None and shown.get('elevation_color') != elevation_color:
+            shown['elevation_color'] = elevation_color
+            self.elevation_label.configure(foreground=elevation_color)
+        if shown.get('strength') != strength:
+            shown['strength'] = strength
+            self.signal_var.set(strength)
+        
+        # Update direction indicator if canvas still exists
+        if (dx, dy) != self._direction and self.direction_canvas.winfo_exists():
+            self._draw_direction_indicator(dx, dy, dz)
+            
+    def _create_direction_indicator(self, size):
+        """Create the radar items once; later updates only move or show/hide them"""
+        canvas = self.direction_canvas
+        
+        # Outer circle (radar) and crosshairs
+        self._radar_circle_id = canvas.create_oval(0, 0, 0, 0, outline="green", width=2)
+        self._radar_cross_ids = (
+            canvas.create_line(0, 0, 0, 0, fill="green", dash=(4, 4)),
+            canvas.create_line(0, 0, 0, 0, fill="green", dash=(4, 4)),
         )
         
-        # Draw crosshairs
-        self.direction_canvas.create_line(
-            center_x, center_y - radius, center_x, center_y + radius, 
-            fill="green", dash=(4, 4)
-        )
-        self.direction_canvas.create_line(
-            center_x - radius, center_y, center_x + radius, center_y, 
-            fill="green", dash=(4, 4)
+        # Victim direction vector and point, hidden until a victim is detected
+        self._direction_arrow_id = canvas.create_line(0, 0, 0, 0, fill="red", width=3, arrow=tk.LAST, state="hidden")
+        self._direction_dot_id = canvas.create_oval(0, 0, 0, 0, fill="red", outline="white", state="hidden")
+        self._no_victim_text_id = canvas.create_text(0, 0, text="No victim detected", fill="gray", font=("Helvetica", 10))
+        
+        # Direction labels: Forward, Back, Left, Right
+        self._radar_label_ids = (
+            canvas.create_text(0, 0, text="Forward", fill="white"),
+            canvas.create_text(0, 0, text="Back", fill="white"),
+            canvas.create_text(0, 0, text="Left", fill="white", angle=90),
+            canvas.create_text(0, 0, text="Right", fill="white", angle=270),
         )
         
-        # If direction is valid, draw victim indicator
+        self._direction = (None, None)
+        self._radar_size = None
+        self._layout_direction_indicator(size, size)
+        # Re-layout only when the canvas is actually resized
+        canvas.bind("<Configure>", self._on_radar_configure)
+
+    def _on_radar_configure(self, event):
+        self._layout_direction_indicator(event.width, event.height)
+
+    def _layout_direction_indicator(self, width, height):
+        """Recompute the cached radar geometry and move every radar item to match"""
+        # Ensure we have minimum dimensions
+        if width < 20 or height < 20:
+            width = height = 150
+        if self._radar_size == (width, height):
+            return
+        self._radar_size = (width, height)
+        
+        # Calculate center
+        center_x = width / 2
+        center_y = height / 2
+        radius = min(center_x, center_y) - 10
+        self._radar_center = (center_x, center_y)
+        self._radar_radius = radius
+        
+        canvas = self.direction_canvas
+        canvas.coords(self._radar_circle_id, center_x - radius, center_y - radius, center_x + radius, center_y + radius)
+        cross_v, cross_h = self._radar_cross_ids
+        canvas.coords(cross_v, center_x, center_y - radius, center_x, center_y + radius)
+        canvas.coords(cross_h, center_x - radius, center_y, center_x + radius, center_y)
+        canvas.coords(self._no_victim_text_id, center_x, center_y)
+        forward, back, left, right = self._radar_label_ids
+        canvas.coords(forward, center_x, center_y - radius - 10)
+        canvas.coords(back, center_x, center_y + radius + 10)
+        canvas.coords(left, center_x - radius - 10, center_y)
+        canvas.coords(right, center_x + radius + 10, center_y)
+        
+        self._draw_direction_indicator(*self._direction, None)
+
+    def _draw_direction_indicator(self, dx, dy, dz):
+        """Point the radar marker at the victim direction (only the marker items change)"""
+        self._direction = (dx, dy)
+        canvas = self.direction_canvas
+        
+        # If direction is valid, show victim indicator
         if dx is not None and dy is not None and (dx != 0 or dy != 0):
+            center_x, center_y = self._radar_center
+            radius = self._radar_radius
             # Calculate endpoint of direction vector
             # Note: Invert y because canvas coordinates increase downward
             end_x = center_x + dx * radius
             end_y = center_y - dy * radius  # Inverted y-axis
             
-            # Draw direction vector
-            self.direction_canvas.create_line(
-                center_x, center_y, end_x, end_y,
-                fill="red", width=3, arrow=tk.LAST
-            )
-            
-            # Draw victim point
-            self.direction_canvas.create_oval(
-                end_x - 5, end_y - 5, end_x + 5, end_y + 5,
-                fill="red", outline="white"
-            )
+            canvas.coords(self._direction_arrow_id, center_x, center_y, end_x, end_y)
+            canvas.coords(self._direction_dot_id, end_x - 5, end_y - 5, end_x + 5, end_y + 5)
+            canvas.itemconfigure(self._direction_arrow_id, state="normal")
+            canvas.itemconfigure(self._direction_dot_id, state="normal")
+            canvas.itemconfigure(self._no_victim_text_id, state="hidden")
         else:
-            # If no vector, draw "not detected" text
-            self.direction_canvas.create_text(
-                center_x, center_y,
-                text="No victim detected",
-                fill="gray", font=("Helvetica", 10)
-            )
-            
-        # Label the directions
-        self.direction_canvas.create_text(center_x, center_y - radius - 10, text="Forward", fill="white")
-        self.direction_canvas.create_text(center_x, center_y + radius + 10, text="Back", fill="white")
-        self.direction_canvas.create_text(center_x - radius - 10, center_y, text="Left", fill="white", angle=90)
-        self.direction_canvas.create_text(center_x + radius + 10, center_y, text="Right", fill="white", angle=270)
+            # If no vector, show "not detected" text
+            canvas.itemconfigure(self._direction_arrow_id, state="hidden")
+            canvas.itemconfigure(self._direction_dot_id, state="hidden")
+            canvas.itemconfigure(self._no_victim_text_id, state="normal")
 
     def _build_status_tab(self, parent):
         """Build the status tab with victim distance indicator"""
@@ -809,14 +974,17 @@ class MenuSystem:
                                          bg="black", highlightthickness=1, highlightbackground="gray")
         self.direction_canvas.pack(pady=10)
         
-        # Draw the initial state (no detection)
-        self._draw_direction_indicator(None, None, None)
+        # Draw the radar in its initial state (no detection)
+        self._create_direction_indicator(canvas_size)
         
         # Signal strength (distance-based)
         ttk.Label(victim_frame, text="Signal strength:").pack(pady=5)
         self.signal_var = tk.DoubleVar(value=0.0)
         self.signal_bar = ttk.Progressbar(victim_frame, variable=self.signal_var, maximum=1.0)
         self.signal_bar.pack(fill="x", pady=5, padx=10)
+        
+        # Last text/color/strength pushed to each indicator widget
+        self._victim_shown = {}
 
     def _change_log_level(self):
         """Change the logging level at runtime"""
@@ -860,14 +1028,9 @@ class MenuSystem:
         if self.verbose:
             print("[MenuSystem] Performing cleanup tasks...")
             
-        # Unsubscribe from all events
-        EM.unsubscribe(SCENE_CREATION_PROGRESS, self._on_scene_progress)
-        EM.unsubscribe(SCENE_CREATION_COMPLETED, self._on_scene_completed)
-        EM.unsubscribe(SCENE_CREATION_CANCELED, self._on_scene_canceled)
-        EM.unsubscribe('dataset/capture/complete', self._update_victim_indicator)
-        EM.unsubscribe('config/updated', self._on_config_updated_gui)
-        EM.unsubscribe('simulation/frame', self._on_simulation_frame)
-        EM.unsubscribe('trigger_ui_update', self._force_ui_update)
+        # Unsubscribe from every event subscribed through _sub in one pass
+        EM.unsubscribe_many(self._subs)
+        self._subs.clear()
         
         # Cancel any pending "after" tasks
         try:
@@ -879,3 +1042,20 @@ class MenuSystem:
             
         if self.verbose:
             print("[MenuSystem] Cleanup complete")
+
+
+# Input widget builder per config field type; any other type gets a text entry
+INPUT_BUILDERS = {
+    bool: MenuSystem._add_bool_input,
+}
+
+# Config tab layout resolved once from CONFIG_GROUPS:
+# (group name, ((key, label text, tooltip, input builder), ...)) per group
+CONFIG_FIELD_ROWS = tuple(
+    (group["name"], tuple(
+        (field['key'], field['desc'] + ":", field.get('tooltip', ''),
+         INPUT_BUILDERS.get(field['type'], MenuSystem._add_entry_input))
+        for field in group['fields']
+    ))
+    for group in CONFIG_GROUPS
+)
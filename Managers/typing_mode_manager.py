@@ -7,6 +7,9 @@ EM = EventManager.get_instance()
 KM = KeyboardManager.get_instance()
 logger = get_logger()
 
+# Keys that submit (or, with an empty buffer, leave) typing mode
+ENTER_KEYS = frozenset(('\r', '\n'))
+
 class TypingModeManager:
     def __init__(self):
         self.current_buffer = ""
@@ -18,7 +21,7 @@ class TypingModeManager:
 
     def _on_key(self, key: str):
         # only handle keys when in typing mode
-        if not KM.in_typing_mode():
+        if not KM.typing_mode:
             return
 
         # ESC ⇒ exit immediately
@@ -28,7 +31,7 @@ class TypingModeManager:
             return
 
         # ENTER ⇒ either submit or exit
-        if key in ('\r', '\n'):
+        if key in ENTER_KEYS:
             if self.current_buffer:
                 cmd = self.current_buffer.strip().lower()
                 logger.debug_at_level(DEBUG_L1, "TypingModeManager", f"Command submitted: '{cmd}'")
@@ -43,7 +46,7 @@ class TypingModeManager:
 
         # any other key: accumulate & echo
         self.current_buffer += key
-        logger.debug_at_level(DEBUG_L3, "TypingModeManager", f"Key added to buffer: '{key}', buffer now: '{self.current_buffer}'")
+        logger.debug_at_level(DEBUG_L3, "TypingModeManager", "Key added to buffer: '%s', buffer now: '%s'", key, self.current_buffer)
         print(key, end='', flush=True)
 
     def start_typing(self):
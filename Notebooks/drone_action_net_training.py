@@ -116,42 +116,38 @@ class DroneBatchDataset(Dataset):
         file_idx, sequence_start_frame_index = self.samples[idx]
         file_path = self.files[file_idx]
 
-        depths = []
-        victim_dirs = []
-        actions = [] # Only needed if include_actions is True
-        distances = []
+        empty = np.empty(0)
+        depths = victim_dirs = actions = distances = empty # actions only needed if include_actions is True
 
         try:
             with np.load(file_path) as data:
-                num_frames_in_file = data['depths'].shape[0] # Assuming depths is always present
-
-                for i in range(self.sequence_length):
-                    frame_idx = sequence_start_frame_index + i
-
-                    if frame_idx < num_frames_in_file: # Safety check
-                        if 'depths' in data:
-                            depths.append(data['depths'][frame_idx])
-                        if 'victim_dirs' in data:
-                            victim_dirs.append(data['victim_dirs'][frame_idx])
-                        if self.include_actions and 'actions' in data:
-                            actions.append(data['actions'][frame_idx])
-                        if 'distances' in data:
-                             distances.append(data['distances'][frame_idx])
+                # Each data[key] access decompresses the whole array, so read every field
+                # once and slice the sequence out of it instead of indexing frame by frame
+                end = sequence_start_frame_index + self.sequence_length
+                if 'depths' in data:
+                    depths = data['depths'][sequence_start_frame_index:end]
+                if 'victim_dirs' in data:
+                    victim_dirs = data['victim_dirs'][sequence_start_frame_index:end]
+                if self.include_actions and 'actions' in data:
+                    actions = data['actions'][sequence_start_frame_index:end]
+                if 'distances' in data:
+                    distances = data['distances'][sequence_start_frame_index:end]
 
 
             # Data validation after loading sequence
             if len(depths) < self.sequence_length or len(victim_dirs) < self.sequence_length:
                  raise ValueError(f"Sample {idx}: Not enough frames to construct sequence (depths or victim_dirs missing or incomplete)")
 
-            depths = torch.from_numpy(np.stack(depths)).unsqueeze(1).float() # Add channel dim
-            vic = torch.from_numpy(np.stack(victim_dirs)).float()
+            # Slices are already stacked; convert to float32 in a single pass (depths may be float16)
+            depths = torch.from_numpy(depths.astype(np.float32, copy=False)).unsqueeze(1) # Add channel dim
+            vic = torch.from_numpy(victim_dirs.astype(np.float32, copy=False))
 
             if len(distances) == self.sequence_length:
-                 vic = np.concatenate([np.stack(victim_dirs), np.expand_dims(np.stack(distances), axis=1)], axis=1)
+                 vic = np.concatenate([victim_dirs, np.expand_dims(distances, axis=1)], axis=1)
                  vic = torch.from_numpy(vic).float()
 
             if self.include_actions and len(actions) == self.sequence_length:
-                actions = torch.from_numpy(np.stack(actions)).long()
+                actions = torch.from_numpy(actions).long()
             elif self.include_actions:
                  # Handle case where actions are missing for this sequence
                  actions = None # Or raise an error depending on your needs
@@ -54,16 +54,20 @@ _last_non_hover = ActionLabel.Hover
 _prev_yaw = None
 
 
-def get_action_label():
+def get_action_label(quad=None, vic=None):
     """
     Determine the drone's action label, with time-based hover debounce and yaw detection.
+    Args:
+        quad, vic: Cached quadcopter/victim handles; looked up by name when not given.
     Returns:
         ActionLabel: Enum value representing the current action.
     """
     global _hover_time_accum, _last_non_hover, _prev_yaw
 
-    quad = SC.sim.getObject('/Quadcopter')
-    vic = SC.sim.getObject('/Victim')
+    if quad is None:
+        quad = SC.sim.getObject('/Quadcopter')
+    if vic is None:
+        vic = SC.sim.getObject('/Victim')
     pos = SC.sim.getObjectPosition(quad, -1)
     vic_pos = SC.sim.getObjectPosition(vic, -1)
     ori = SC.sim.getObjectOrientation(quad, -1)
@@ -8,18 +8,28 @@ from Utils.log_utils import get_logger
 SC = SimConnection.get_instance()
 logger = get_logger()
 
-def capture_depth(sensor_handle):
+def capture_depth(sensor_handle, out=None):
     """
     Capture and return depth image from a vision sensor.
+    If `out` is an array of the sensor's (height, width), the flipped image is
+    written into it (converted to its dtype) and `out` is returned; otherwise a new array is returned.
     """
     try:
         SC.sim.handleVisionSensor(sensor_handle)
         raw_depth, (width, height) = SC.sim.getVisionSensorDepth(sensor_handle)
-        depth_buffer = SC.sim.unpackFloatTable(raw_depth)
-        depth_img = np.array(depth_buffer, dtype=np.float32).reshape((height, width))
+        if isinstance(raw_depth, (bytes, bytearray, memoryview)):
+            # View the packed float buffer in place: no unpack RPC and no intermediate list
+            depth_img = np.frombuffer(raw_depth, dtype=np.float32).reshape((height, width))
+        else:
+            depth_buffer = SC.sim.unpackFloatTable(raw_depth)
+            depth_img = np.asarray(depth_buffer, dtype=np.float32).reshape((height, width))
         # Flip the image upside down
-        depth_img = np.flipud(depth_img)
-        logger.debug_at_level(3, "CaptureUtils", f"Captured depth image {width}x{height}")
+        if out is not None and out.shape == (height, width):
+            out[...] = depth_img[::-1]
+            depth_img = out
+        else:
+            depth_img = np.flipud(depth_img).copy()  # Own the data (the buffer view is read-only)
+        logger.debug_at_level(3, "CaptureUtils", "Captured depth image %dx%d", width, height)
         return depth_img
     except Exception as e:
         logger.error("CaptureUtils", f"Error capturing depth: {e}")
@@ -36,26 +46,37 @@ def capture_rgb(sensor_handle):
         rgb_img = np.array(rgb_buffer, dtype=np.float32).reshape((height, width, 3))
         # Flip the image upside down
         rgb_img = np.flipud(rgb_img)
-        logger.debug_at_level(3, "CaptureUtils", f"Captured RGB image {width}x{height}")
+        logger.debug_at_level(3, "CaptureUtils", "Captured RGB image %dx%d", width, height)
         return rgb_img
     except Exception as e:
         logger.error("CaptureUtils", f"Error capturing RGB: {e}")
         return np.zeros((1, 1, 3), dtype=np.float32)  # Return empty array on error
 
-def capture_pose():
+def capture_pose(out=None, quad_handle=None):
     """
     Capture and return drone pose (position + orientation).
+    If `out` is given, the pose is written into that float32 array of length 6.
+    A cached `quad_handle` skips the name lookup.
     """
+    pose = np.empty(6, dtype=np.float32) if out is None else out
     try:
-        parent_handle = SC.sim.getObject('/Quadcopter')
-        pos = SC.sim.getObjectPosition(parent_handle, -1)
-        ori = SC.sim.getObjectOrientation(parent_handle, -1)
-        pose = np.array([pos[0], pos[1], pos[2], ori[0], ori[1], ori[2]], dtype=np.float32)
-        logger.debug_at_level(3, "CaptureUtils", f"Captured pose: {pose}")
-        return pose
+        parent_handle = SC.sim.getObject('/Quadcopter') if quad_handle is None else quad_handle
+        pose[:3] = SC.sim.getObjectPosition(parent_handle, -1)
+        pose[3:] = SC.sim.getObjectOrientation(parent_handle, -1)
+        logger.debug_at_level(3, "CaptureUtils", "Captured pose: %s", pose)
     except Exception as e:
         logger.error("CaptureUtils", f"Error capturing pose: {e}")
-        return np.zeros(6, dtype=np.float32)  # Return zeros on error
+        pose.fill(0.0)  # Zeros on error
+    return pose
+
+def capture_victim_position(victim_handle=None):
+    """
+    Return the victim's world position.
+    A cached `victim_handle` skips the name lookup.
+    """
+    if victim_handle is None:
+        victim_handle = SC.sim.getObject('/Victim')
+    return SC.sim.getObjectPosition(victim_handle, -1)
 
 def capture_distance_to_victim():
     """
@@ -76,7 +97,7 @@ def capture_distance_to_victim():
         dz = quad_pos[2] - victim_pos[2]
         distance = math.sqrt(dx*dx + dy*dy + dz*dz)
         
-        logger.debug_at_level(2, "CaptureUtils", f"Distance to victim: {distance:.2f}m")
+        logger.debug_at_level(2, "CaptureUtils", "Distance to victim: %.2fm", distance)
         return distance
     except Exception as e:
         logger.error("CaptureUtils", f"Error calculating distance to victim: {e}")
@@ -62,6 +62,9 @@ CONFIG_GROUPS = [
     },
 ]
 
+# Field definition per config key, so lookups don't scan CONFIG_GROUPS
+FIELD_BY_KEY = {field["key"]: field for group in CONFIG_GROUPS for field in group["fields"]}
+
 # Get Default Config
 def get_default_config():
     config = {
@@ -268,7 +268,17 @@ class Logger:
         """Log a debug message from a specific module."""
         self.logger.debug(f"[{module}] {message}")
     
-    def debug_at_level(self, level: int, module: str, message: str):
+    def is_enabled(self, level: int) -> bool:
+        """
+        Check whether debug messages at the given debug level would be logged.
+        Use to skip building expensive messages on hot paths.
+        
+        Args:
+            level: Debug level to check (1-3)
+        """
+        return self.verbose and level <= self.current_debug_level
+    
+    def debug_at_level(self, level: int, module: str, message: str, *args):
         """
         Log a debug message with a specific debug level.
         Message will only be logged if the configured debug_level is >= the specified level.
@@ -276,12 +286,15 @@ class Logger:
         Args:
             level: Debug level required for this message (1-3)
             module: The name of the module generating the log
-            message: The message to log
+            message: The message to log; %-formatted with `args` only if it is logged
+            args: Optional values for lazy %-formatting of `message`
         """
         if not self.verbose:
             return
             
         if level <= self.current_debug_level:
+            if args:
+                message = message % args
             self.logger.debug(f"[{module}][L{level}] {message}")
     
     def info(self, module: str, message: str):
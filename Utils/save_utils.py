@@ -1,59 +1,101 @@
+import io
 import numpy as np
-import os
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 
-from Utils.config_utils import get_default_config
 from Utils.log_utils import get_logger
 
 logger = get_logger()
 
-def save_batch_npz(folder, counter, batch_data):
+# User-space buffer used when streaming compressed archives to disk
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Worker threads compressing archive members concurrently (zlib releases the GIL).
+# One pool is shared by every save, so concurrent episode saves don't multiply the threads.
+COMPRESS_WORKERS = 4
+_compress_pool = ThreadPoolExecutor(max_workers=COMPRESS_WORKERS, thread_name_prefix="NpzCompress")
+
+# Largest member/archive size representable without ZIP64 records
+_ZIP32_LIMIT = 0xFFFFFFFF
+# Upper bound on the size of an .npy header (format 1.0 stores its length in 16 bits)
+_NPY_HEADER_MAX = 0x10000 + 10
+
+def _deflate_npy(array):
+    """
+    Serialize `array` in .npy format and raw-deflate it.
+    Returns (crc32, uncompressed size, compressed bytes).
+    """
+    buf = io.BytesIO()
+    np.lib.format.write_array(buf, np.asanyarray(array), allow_pickle=False)
+    raw = buf.getbuffer()
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
+    data = compressor.compress(raw) + compressor.flush()
+    return zlib.crc32(raw), len(raw), data
+
+def _write_zip(f, members):
+    """
+    Write pre-deflated `members` [(name, (crc, size, data))] to `f` as a zip archive,
+    in the layout np.load() reads for .npz files.
+    """
+    t = time.localtime()
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+
+    offset = 0
+    central = []
+    for name, (crc, size, data) in members:
+        name = name.encode('utf-8')
+        header = struct.pack('<IHHHHHIIIHH', 0x04034b50, 20, 0, zlib.DEFLATED,
+                             dos_time, dos_date, crc, len(data), size, len(name), 0)
+        f.write(header)
+        f.write(name)
+        f.write(data)
+        central.append(struct.pack('<IHHHHHHIIIHHHHHII', 0x02014b50, 20, 20, 0, zlib.DEFLATED,
+                                   dos_time, dos_date, crc, len(data), size, len(name),
+                                   0, 0, 0, 0, 0o644 << 16, offset) + name)
+        offset += len(header) + len(name) + len(data)
+
+    central = b''.join(central)
+    f.write(central)
+    f.write(struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, len(members), len(members),
+                        len(central), offset, 0))
+
+def _deflate_bound(size):
+    """Upper bound on the raw-deflated size of `size` bytes (zlib's deflateBound plus slack)."""
+    return size + (size >> 12) + (size >> 14) + (size >> 25) + 64
+
+def _fits_zip32(arrays):
     """
-    Save a batch dictionary into a compressed .npz file,
-    with detailed logging and error handling.
+    Whether the archive _write_zip() produces for `arrays` is certain to fit without
+    ZIP64 records, judged from the array sizes before anything is compressed.
     """
-    filename = os.path.join(folder, f"batch_{counter:06d}.npz")
-    verbose = get_default_config().get('verbose', False)
-    try:
-        # Verify all required data is present
-        required_keys = ['depths', 'poses', 'frames', 'distances', 'actions', 'victim_dirs']
-        missing_keys = [key for key in required_keys if key not in batch_data]
-        
-        if missing_keys:
-            logger.error("SaveUtils", f"Missing data keys: {missing_keys}")
+    size = 22  # end of central directory record
+    for name, array in arrays.items():
+        raw_size = array.nbytes + _NPY_HEADER_MAX
+        if raw_size >= _ZIP32_LIMIT:
             return False
-            
-        # Save the data
-        np.savez_compressed(
-            filename,
-            depths      = batch_data['depths'],
-            poses       = batch_data['poses'],
-            frames      = batch_data['frames'],
-            distances   = batch_data['distances'],
-            actions     = batch_data['actions'],
-            victim_dirs = batch_data['victim_dirs'],
-        )
-        
-        # Log summary statistics
-        logger.info("SaveUtils", f"Saved batch to {filename}")
-        
-        # Print detailed statistics in verbose mode
-        if verbose:
-            logger.debug_at_level(1, "SaveUtils", f"Depths shape: {batch_data['depths'].shape}")
-            logger.debug_at_level(1, "SaveUtils", f"Poses shape: {batch_data['poses'].shape}")
-            logger.debug_at_level(1, "SaveUtils", f"Frames count: {len(batch_data['frames'])}")
-            logger.debug_at_level(1, "SaveUtils", f"Actions count: {len(batch_data['actions'])}")
-            logger.debug_at_level(1, "SaveUtils", f"Victim dirs shape: {batch_data['victim_dirs'].shape}")
-        
-        return True
-        
-    except Exception as e:
-        logger.error("SaveUtils", f"Error saving batch to {filename}: {e}")
-        # More detailed error diagnostics
-        for key, value in batch_data.items():
-            try:
-                shape_or_len = value.shape if hasattr(value, 'shape') else len(value)
-                if verbose:
-                    logger.debug_at_level(1, "SaveUtils", f"{key}: type={type(value)}, shape/len={shape_or_len}")
-            except Exception as detail_error:
-                logger.error("SaveUtils", f"Error getting shape/length for {key}: {detail_error}")
-        return False
+        name_len = len(f"{name}.npy".encode('utf-8'))
+        size += 30 + 46 + 2 * name_len + _deflate_bound(raw_size)  # local header, central entry, data
+    return size < _ZIP32_LIMIT
+
+def write_npz_compressed(path, arrays):
+    """
+    Write `arrays` (name -> ndarray) to `path` as a compressed .npz file.
+    Each array is compressed on its own worker thread and the members are then
+    assembled into one archive, streamed to disk through a large user-space buffer.
+    Raises on failure; the caller decides how to report it.
+    """
+    # Decided before compressing, so an oversized archive is only compressed once
+    fits_zip32 = _fits_zip32(arrays)
+    if fits_zip32:
+        compressed = list(_compress_pool.map(_deflate_npy, arrays.values()))
+        members = [(f"{name}.npy", member) for name, member in zip(arrays, compressed)]
+
+    with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        if fits_zip32:
+            _write_zip(f, members)
+        else:
+            # Too large for a plain zip; let numpy write ZIP64 records (compresses serially)
+            np.savez_compressed(f, **arrays)
@@ -1,10 +1,10 @@
 # main.py
 
 import time
-import queue
 import argparse
 import os
 import logging
+from collections import deque
 from Managers.depth_dataset_collector    import DepthDatasetCollector
 from Managers.episode_manager           import EpisodeManager
 from Utils.scene_utils                   import setup_scene_event_handlers
@@ -27,7 +27,7 @@ logger = get_logger()
 
 # Then initialize all the other singleton instances
 EM = EventManager.get_instance()
-KeyboardManager.get_instance()
+KM = KeyboardManager.get_instance()
 SC = SimConnection.get_instance()
 # Initialize SceneManager early to ensure its event handlers are registered
 SM = get_scene_manager()
@@ -95,7 +95,8 @@ def main():
         running = False
     EM.subscribe('simulation/shutdown', _on_app_quit)
 
-    sim_command_queue = queue.Queue()
+    # (fn, args) commands handed to the main loop; deque append/popleft need no extra lock
+    sim_command_queue = deque()
 
     sim.setStepping(True)
     
@@ -157,15 +158,19 @@ def main():
             if locked:
                 
                 # Process commands from queue
-                while not sim_command_queue.empty():
-                    fn, args, kwargs = sim_command_queue.get()
-                    fn(*args, **kwargs)
+                while sim_command_queue:
+                    fn, args = sim_command_queue.popleft()
+                    fn(*args)
+                
+                # Deliver keys pressed since the last frame (polled from stdin on Unix,
+                # queued by the keyboard thread on Windows)
+                KM.dispatch_pending_keys()
                 
                 # No need to call update_progressive_scene_creation - the event system handles this
                 # Vision sensors are now handled by CameraManager via events
                 
                 # Publish frame event with delta time
-                EM.publish('simulation/frame', delta_time)
+                EM.publish_fast('simulation/frame', delta_time)
         
         # Step the simulation
         sim.step()
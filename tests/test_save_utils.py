@@ -0,0 +1,71 @@
+# tests/test_save_utils.py
+
+import zipfile
+
+import numpy as np
+import pytest
+
+import Utils.save_utils as save_utils
+from Utils.save_utils import write_npz_compressed
+
+
+def _episode_arrays(n=12, height=6, width=8):
+    """Six episode fields shaped and typed as DepthDatasetCollector saves them."""
+    rng = np.random.default_rng(0)
+    # Buffers have spare capacity; the collector saves the first n rows
+    depths = rng.random((2 * n, height, width)).astype(np.float16)
+    poses = rng.random((2 * n, 6)).astype(np.float32)
+    return {
+        'depths': depths[:n],
+        'poses': poses[:n],
+        'frames': np.arange(n, dtype=np.int32) * 5,
+        'distances': rng.random(n).astype(np.float32),
+        'actions': rng.integers(0, 9, n).astype(np.uint8),
+        # Non-contiguous: every other column of a wider array
+        'victim_dirs': rng.random((n, 8)).astype(np.float32)[:, ::2],
+    }
+
+
+def _assert_round_trip(path, arrays):
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+        assert sorted(archive.namelist()) == sorted(f"{name}.npy" for name in arrays)
+    with np.load(path) as loaded:
+        assert sorted(loaded.files) == sorted(arrays)
+        for name, array in arrays.items():
+            assert loaded[name].dtype == array.dtype
+            assert loaded[name].shape == array.shape
+            np.testing.assert_array_equal(loaded[name], array)
+
+
+def test_zip32_round_trip(tmp_path):
+    arrays = _episode_arrays()
+    assert not arrays['victim_dirs'].flags.c_contiguous
+    path = tmp_path / "episode.npz"
+
+    assert save_utils._fits_zip32(arrays)
+    write_npz_compressed(path, arrays)
+
+    _assert_round_trip(path, arrays)
+
+
+def test_zip64_fallback_round_trip(tmp_path, monkeypatch):
+    arrays = _episode_arrays()
+    path = tmp_path / "episode.npz"
+    # Shrink the limit so this small archive takes the np.savez_compressed path
+    monkeypatch.setattr(save_utils, '_ZIP32_LIMIT', 1024)
+
+    assert not save_utils._fits_zip32(arrays)
+    write_npz_compressed(path, arrays)
+
+    _assert_round_trip(path, arrays)
+
+
+@pytest.mark.parametrize("n", [1, 200])
+def test_round_trip_episode_lengths(tmp_path, n):
+    arrays = _episode_arrays(n=n)
+    path = tmp_path / "episode.npz"
+
+    write_npz_compressed(path, arrays)
+
+    _assert_round_trip(path, arrays)